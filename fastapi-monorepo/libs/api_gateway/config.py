@@ -227,13 +227,23 @@ class GatewayConfig(BaseModel):
         arbitrary_types_allowed = True
     
     @classmethod
-    def create_default(cls) -> "GatewayConfig":
-        """Create default gateway configuration"""
+    def create_default(
+        cls,
+        auth: Optional[AuthConfig] = None,
+        rate_limiting: Optional[RateLimitConfig] = None
+    ) -> "GatewayConfig":
+        """
+        Create default gateway configuration
+        
+        Args:
+            auth: Authentication config to use instead of the default one
+            rate_limiting: Rate limiting config to use instead of the default one
+        """
         return cls(
-            auth=AuthConfig(
+            auth=auth or AuthConfig(
                 jwt_secret="your-secret-key-change-in-production"
             ),
-            rate_limiting=RateLimitConfig(),
+            rate_limiting=rate_limiting or RateLimitConfig(),
             cors=CORSConfig(),
             tracing=TracingConfig(),
             metrics=MetricsConfig(),
@@ -3,11 +3,10 @@ Event Bus implementation using Redis as message broker
 """
 
 import asyncio
-import json
 import logging
 import uuid
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any
 from dataclasses import dataclass
 import redis.asyncio as redis
 
@@ -49,18 +48,24 @@ class EventBus:
         redis_url: str = "redis://localhost:6379",
         service_name: str = "unknown",
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        batch_size: int = 100
     ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        
         self.redis_url = redis_url
         self.service_name = service_name
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.batch_size = batch_size  # Max events per pipeline round-trip in publish_many
         
         self.redis_client: Optional[redis.Redis] = None
         self.pubsub: Optional[redis.client.PubSub] = None
         self.handlers: Dict[EventType, List[EventHandler]] = {}
         self.is_connected = False
         self.subscriber_tasks: List[asyncio.Task] = []
+        self._subscriber_loops: Dict[EventType, asyncio.Task] = {}  # One pub/sub loop per event type
     
     async def connect(self):
         """Connect to Redis message broker"""
@@ -96,6 +101,10 @@ class EventBus:
                     pass
             
             self.subscriber_tasks.clear()
+            self._subscriber_loops.clear()
+            
+            # Subscriptions belong to the connection - subscribers re-register after reconnecting
+            self.handlers.clear()
             
             # Close pubsub
             if self.pubsub:
@@ -142,7 +151,7 @@ class EventBus:
         
         try:
             # Serialize event
-            event_data = event.model_dump_json()
+            event_data = event.to_bytes()
             
             # Publish to channel
             channel = f"events:{event.event_type.value}"
@@ -155,16 +164,7 @@ class EventBus:
                     # Optionally persist to Redis stream for durability
                     if persist:
                         stream_key = f"events_stream:{event.event_type.value}"
-                        await self.redis_client.xadd(
-                            stream_key,
-                            {
-                                "event_id": event.event_id,
-                                "event_type": event.event_type.value,
-                                "timestamp": event.timestamp.isoformat(),
-                                "source_service": event.source_service,
-                                "data": event_data
-                            }
-                        )
+                        await self.redis_client.xadd(stream_key, self._stream_fields(event, event_data))
                     
                     logger.info(
                         f"Published event: {event.event_type.value} "
@@ -189,6 +189,83 @@ class EventBus:
                 event_data=event.model_dump()
             )
     
+    async def publish_many(
+        self,
+        events: Iterable[BaseEvent],
+        persist: bool = True
+    ) -> int:
+        """
+        Publish many events using pipelined round-trips
+        
+        Events are sent in batches of `batch_size`; each batch is one
+        non-transactional pipeline, i.e. a single round-trip to Redis, retried
+        like `publish`. The input events are not modified - each is copied with
+        this bus's service name as source_service.
+        
+        Args:
+            events: Events to publish
+            persist: Whether to persist events to Redis stream
+            
+        Returns:
+            Number of events published
+            
+        Raises:
+            EventPublishError: If a batch still fails after all retries;
+                `published_count` holds the number of events from earlier
+                batches that were already published
+        """
+        if not self.is_connected:
+            await self.connect()
+        
+        events = [event.model_copy(update={"source_service": self.service_name}) for event in events]
+        published = 0
+        
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start:start + self.batch_size]
+            payloads = [(event, event.to_bytes()) for event in batch]
+            
+            for attempt in range(self.max_retries):
+                try:
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        for event, event_data in payloads:
+                            pipe.publish(f"events:{event.event_type.value}", event_data)
+                            if persist:
+                                pipe.xadd(
+                                    f"events_stream:{event.event_type.value}",
+                                    self._stream_fields(event, event_data)
+                                )
+                        await pipe.execute()
+                    break
+                    
+                except Exception as e:
+                    logger.warning(f"Publish batch attempt {attempt + 1} failed: {e}")
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self.retry_delay)
+                    else:
+                        logger.error(
+                            f"Failed to publish batch of {len(batch)} events "
+                            f"({published}/{len(events)} already published): {e}"
+                        )
+                        raise EventPublishError(
+                            f"Failed to publish events after {published} of {len(events)} were published: {e}",
+                            published_count=published
+                        )
+            
+            published += len(batch)
+        
+        logger.info(f"Published {published} events in pipelined batches of {self.batch_size}")
+        return published
+    
+    def _stream_fields(self, event: BaseEvent, event_data: bytes) -> Dict[str, Any]:
+        """Build Redis stream entry for event persistence"""
+        return {
+            "event_id": event.event_id,
+            "event_type": event.event_type.value,
+            "timestamp": event.timestamp.isoformat(),
+            "source_service": event.source_service,
+            "data": event_data
+        }
+    
     async def subscribe(self, event_handler: EventHandler):
         """
         Subscribe to event type with handler
@@ -199,18 +276,19 @@ class EventBus:
         if not self.is_connected:
             await self.connect()
         
-        # Add handler to registry
-        if event_handler.event_type not in self.handlers:
-            self.handlers[event_handler.event_type] = []
-        
-        self.handlers[event_handler.event_type].append(event_handler)
+        # Add handler to registry (one dispatch list per event type)
+        self.handlers.setdefault(event_handler.event_type, []).append(event_handler)
         
-        # Start subscriber task if not already running
+        # Start subscriber task if this event type has no running loop - the loop
+        # dispatches to every handler registered for the event type
         channel = f"events:{event_handler.event_type.value}"
-        task = asyncio.create_task(
-            self._subscriber_loop(channel, event_handler.event_type)
-        )
-        self.subscriber_tasks.append(task)
+        loop_task = self._subscriber_loops.get(event_handler.event_type)
+        if loop_task is None or loop_task.done():
+            task = asyncio.create_task(
+                self._subscriber_loop(channel, event_handler.event_type)
+            )
+            self._subscriber_loops[event_handler.event_type] = task
+            self.subscriber_tasks.append(task)
         
         logger.info(
             f"Subscribed to {event_handler.event_type.value} "
@@ -232,12 +310,10 @@ class EventBus:
                 if message['type'] == 'message':
                     try:
                         # Parse event data
-                        event_data = json.loads(message['data'])
-                        event = BaseEvent.model_validate(event_data)
+                        event = BaseEvent.from_bytes(message['data'])
                         
                         # Execute all handlers for this event type
-                        handlers = self.handlers.get(event_type, [])
-                        for handler in handlers:
+                        for handler in self.handlers.get(event_type, ()):
                             try:
                                 await self._execute_handler(handler, event)
                             except Exception as e:
@@ -338,8 +414,7 @@ class EventBus:
             parsed_events = []
             for event_id, fields in events:
                 try:
-                    event_data = json.loads(fields['data'])
-                    event = BaseEvent.model_validate(event_data)
+                    event = BaseEvent.from_bytes(fields['data'])
                     parsed_events.append(event)
                 except Exception as e:
                     logger.warning(f"Failed to parse event {event_id}: {e}")
@@ -378,7 +453,7 @@ class EventBus:
                 "redis_version": info.get("redis_version"),
                 "connected_clients": info.get("connected_clients"),
                 "used_memory": info.get("used_memory_human"),
-                "handlers_count": sum(len(handlers) for handlers in self.handlers.values()),
+                "handlers_count": sum(map(len, self.handlers.values())),
                 "active_subscriptions": len(self.subscriber_tasks)
             }
             
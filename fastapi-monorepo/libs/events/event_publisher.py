@@ -4,7 +4,7 @@ Event Publisher utility for easy event publishing
 
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Tuple
 import logging
 
 from .event_bus import EventBus
@@ -117,6 +117,39 @@ class EventPublisher:
         
         return await self.event_bus.publish(event)
     
+    async def publish_product_stock_updates(
+        self,
+        stock_changes: Dict[int, Tuple[int, int]],
+        updated_by_user_id: int,
+        correlation_id: Optional[str] = None
+    ) -> int:
+        """
+        Publish one product.stock_updated event per product in pipelined batches
+        
+        Args:
+            stock_changes: Map product_id -> (old_quantity, new_quantity)
+            updated_by_user_id: User who updated the stock
+            correlation_id: Optional correlation ID shared by all events
+            
+        Returns:
+            Number of events published
+        """
+        events = [
+            ProductEvent.product_stock_updated(
+                event_id=self._generate_event_id(),
+                source_service=self.event_bus.service_name,
+                product_id=product_id,
+                old_quantity=old_quantity,
+                new_quantity=new_quantity,
+                quantity_change=new_quantity - old_quantity,
+                updated_by_user_id=updated_by_user_id,
+                correlation_id=correlation_id
+            )
+            for product_id, (old_quantity, new_quantity) in stock_changes.items()
+        ]
+        
+        return await self.publish_many(events)
+    
     async def publish_article_created(
         self,
         article_id: int,
@@ -156,3 +189,7 @@ class EventPublisher:
         )
         
         return await self.event_bus.publish(event)
+    
+    async def publish_many(self, events: Iterable[BaseEvent]) -> int:
+        """Publish prebuilt events in pipelined batches"""
+        return await self.event_bus.publish_many(events)
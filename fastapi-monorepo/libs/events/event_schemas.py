@@ -50,6 +50,15 @@ class BaseEvent(BaseModel):
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
+    
+    def to_bytes(self) -> bytes:
+        """Serialize event to JSON bytes (wire format for Redis)"""
+        return self.model_dump_json().encode()
+    
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str]) -> "BaseEvent":
+        """Deserialize event from JSON bytes/str produced by to_bytes()"""
+        return cls.model_validate_json(data)
 
 
 class UserEvent(BaseEvent):
@@ -32,38 +32,49 @@ class EventSubscriber:
                 print(f"User created: {event.data['username']}")
         """
         def decorator(func: Callable[[BaseEvent], None]):
-            @wraps(func)
-            async def wrapper(event: BaseEvent):
-                try:
-                    logger.debug(f"Handling {event_type.value} event: {event.event_id}")
-                    
-                    if asyncio.iscoroutinefunction(func):
-                        await func(event)
-                    else:
-                        func(event)
-                    
-                    logger.debug(f"Successfully handled {event_type.value} event: {event.event_id}")
-                    
-                except Exception as e:
-                    logger.error(f"Error handling {event_type.value} event {event.event_id}: {e}")
-                    raise
-            
-            # Register handler
-            handler = EventHandler(
-                event_type=event_type,
-                handler_func=wrapper,
-                service_name=self.event_bus.service_name
-            )
-            
-            if event_type not in self.handlers:
-                self.handlers[event_type] = []
-            
-            self.handlers[event_type].append(handler)
-            
-            return wrapper
+            handler = self._create_handler(event_type, func)
+            self.handlers.setdefault(event_type, []).append(handler)
+            return handler.handler_func
         
         return decorator
     
+    def register_many(self, mapping: Dict[EventType, Callable[[BaseEvent], None]]):
+        """
+        Register several event handlers in one call
+        
+        Usage:
+            subscriber.register_many({
+                EventType.USER_CREATED: handle_user_created,
+                EventType.PRODUCT_CREATED: handle_product_created,
+            })
+        """
+        for event_type, func in mapping.items():
+            self.handlers.setdefault(event_type, []).append(self._create_handler(event_type, func))
+    
+    def _create_handler(self, event_type: EventType, func: Callable[[BaseEvent], None]) -> EventHandler:
+        """Wrap func with logging/error handling and build its EventHandler"""
+        @wraps(func)
+        async def wrapper(event: BaseEvent):
+            try:
+                logger.debug(f"Handling {event_type.value} event: {event.event_id}")
+                
+                if asyncio.iscoroutinefunction(func):
+                    await func(event)
+                else:
+                    func(event)
+                
+                logger.debug(f"Successfully handled {event_type.value} event: {event.event_id}")
+                
+            except Exception as e:
+                logger.error(f"Error handling {event_type.value} event {event.event_id}: {e}")
+                raise
+        
+        return EventHandler(
+            event_type=event_type,
+            handler_func=wrapper,
+            service_name=self.event_bus.service_name
+        )
+    
     async def start_all_subscriptions(self):
         """Start all registered event subscriptions"""
         for event_type, handlers in self.handlers.items():
@@ -73,11 +84,15 @@ class EventSubscriber:
     
     def get_handler_count(self) -> int:
         """Get total number of registered handlers"""
-        return sum(len(handlers) for handlers in self.handlers.values())
+        return sum(map(len, self.handlers.values()))
     
     def get_subscribed_events(self) -> list:
         """Get list of subscribed event types"""
         return list(self.handlers.keys())
+    
+    def clear_handlers(self):
+        """Remove all registered handlers (subscriptions already started are not affected)"""
+        self.handlers.clear()
 
 
 # Convenience functions for common event handling patterns
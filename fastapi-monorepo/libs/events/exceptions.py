@@ -21,7 +21,17 @@ class EventBusError(Exception):
 
 class EventPublishError(EventBusError):
     """Error publishing event to message broker"""
-    pass
+    
+    def __init__(
+        self,
+        message: str,
+        event_type: Optional[str] = None,
+        event_data: Optional[Dict[str, Any]] = None,
+        published_count: int = 0
+    ):
+        super().__init__(message, event_type=event_type, event_data=event_data)
+        # Events already published before the failure (batched publishing)
+        self.published_count = published_count
 
 
 class EventSubscribeError(EventBusError):
@@ -22,6 +22,9 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits of the HTTP client shared by a ServiceRegistry
+SHARED_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
 
 class RetryStrategy(Enum):
     EXPONENTIAL_BACKOFF = "exponential_backoff"
@@ -66,12 +69,27 @@ class ServiceRegistry:
         self.services: Dict[str, ServiceInfo] = {}
         self.health_check_interval = 30  # seconds
         self._health_check_task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def register_service(self, service_info: ServiceInfo):
         """Register a service"""
         self.services[service_info.name] = service_info
         logger.info(f"Registered service: {service_info.name} at {service_info.base_url}")
     
+    def register_service_idempotent(self, service_info: ServiceInfo) -> ServiceInfo:
+        """
+        Register a service only if no service with the same name exists
+        
+        Returns the registered ServiceInfo - the existing one (with its circuit
+        breaker state) when the name was already present.
+        """
+        existing = self.services.get(service_info.name)
+        if existing is not None:
+            return existing
+        self.register_service(service_info)
+        return service_info
+    
     def get_service(self, service_name: str) -> Optional[ServiceInfo]:
         """Get service info by name"""
         return self.services.get(service_name)
@@ -80,6 +98,34 @@ class ServiceRegistry:
         """Get list of healthy services"""
         return [service for service in self.services.values() if service.is_healthy]
     
+    def shared_client(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP client shared by all ServiceClients using this registry
+        
+        Keeps one keep-alive connection pool per registry instead of one per client.
+        The pool is bound to the event loop that created it, so a new client is
+        created when the registry is used from a different loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                # Connections of the old loop cannot be closed from this one - drop them
+                logger.debug("Event loop changed, recreating shared HTTP client")
+            self._client = httpx.AsyncClient(limits=SHARED_CLIENT_LIMITS)
+            self._client_loop = loop
+        return self._client
+    
+    async def close_async(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
     async def start_health_monitoring(self):
         """Start background health monitoring"""
         if self._health_check_task is None:
@@ -112,15 +158,17 @@ class ServiceRegistry:
         """Check health of all registered services"""
         for service in self.services.values():
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    response = await client.get(f"{service.base_url}{service.health_endpoint}")
-                    service.is_healthy = response.status_code == 200
-                    service.last_health_check = asyncio.get_event_loop().time()
-                    
-                    if service.is_healthy:
-                        logger.debug(f"Service {service.name} is healthy")
-                    else:
-                        logger.warning(f"Service {service.name} health check failed: {response.status_code}")
+                response = await self.shared_client().get(
+                    f"{service.base_url}{service.health_endpoint}",
+                    timeout=5.0
+                )
+                service.is_healthy = response.status_code == 200
+                service.last_health_check = asyncio.get_event_loop().time()
+                
+                if service.is_healthy:
+                    logger.debug(f"Service {service.name} is healthy")
+                else:
+                    logger.warning(f"Service {service.name} health check failed: {response.status_code}")
                         
             except Exception as e:
                 service.is_healthy = False
@@ -143,13 +191,24 @@ class ServiceClient:
         service_name: str,
         service_registry: Optional[ServiceRegistry] = None,
         retry_config: Optional[RetryConfig] = None,
-        default_timeout: float = 30.0
+        default_timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None
     ):
         self.service_name = service_name
         self.service_registry = service_registry
         self.retry_config = retry_config or RetryConfig()
         self.default_timeout = default_timeout
-        self.client = httpx.AsyncClient(timeout=default_timeout)
+        
+        # Without an explicit client, borrow the registry's pooled one; only a client created here is closed by close()
+        self._owns_client = client is None and service_registry is None
+        self._client = httpx.AsyncClient(timeout=default_timeout) if self._owns_client else client
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client used for requests"""
+        if self._client is not None:
+            return self._client
+        return self.service_registry.shared_client()
     
     async def get(
         self,
@@ -237,12 +296,13 @@ class ServiceClient:
         Execute HTTP request with retry logic
         """
         last_exception = None
+        timeout = kwargs.pop("timeout", self.default_timeout)
         
         for attempt in range(self.retry_config.max_attempts):
             try:
                 logger.debug(f"Attempt {attempt + 1}/{self.retry_config.max_attempts}: {method} {url}")
                 
-                response = await self.client.request(method, url, **kwargs)
+                response = await self.client.request(method, url, timeout=timeout, **kwargs)
                 
                 # Log request/response
                 logger.info(f"{method} {url} -> {response.status_code}")
@@ -356,8 +416,9 @@ class ServiceClient:
         return None
     
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Close HTTP client (a shared client is closed by its ServiceRegistry)"""
+        if self._owns_client:
+            await self.client.aclose()
     
     async def __aenter__(self):
         return self
@@ -0,0 +1,63 @@
+"""
+Service Catalog - danh sách các process cần khởi động trong monorepo
+Dùng chung cho các script start_all.py / start_clean.py / start_quiet.py
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Tuple
+
+# Thư mục gốc của monorepo (cha của libs/)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceSpec:
+    """Cấu hình khởi động của một service"""
+    name: str
+    short_name: str
+    path: str
+    script: str
+    port: int
+    url: str
+    color: str
+
+
+SERVICES: Tuple[ServiceSpec, ...] = (
+    ServiceSpec(
+        name="Auth Service",
+        short_name="Auth",
+        path=os.path.join(BASE_DIR, "services", "auth"),
+        script="start.py",
+        port=8001,
+        url="http://localhost:8001",
+        color="\033[94m"  # Blue
+    ),
+    ServiceSpec(
+        name="Articles Service",
+        short_name="Articles",
+        path=os.path.join(BASE_DIR, "services", "articles"),
+        script="start.py",
+        port=8002,
+        url="http://localhost:8002",
+        color="\033[92m"  # Green
+    ),
+    ServiceSpec(
+        name="Products Service",
+        short_name="Products",
+        path=os.path.join(BASE_DIR, "services", "products"),
+        script="start.py",
+        port=8003,
+        url="http://localhost:8003",
+        color="\033[93m"  # Yellow
+    ),
+    ServiceSpec(
+        name="API Gateway",
+        short_name="Gateway",
+        path=BASE_DIR,
+        script="start_gateway.py",
+        port=8080,
+        url="http://localhost:8080",
+        color="\033[95m"  # Magenta
+    ),
+)
@@ -0,0 +1,792 @@
+#!/usr/bin/env python
+"""
+Monorepo Manager - khởi động và theo dõi tất cả services trong FastAPI Monorepo
+Dùng chung cho các script start_all.py / start_clean.py / start_quiet.py
+
+Các chế độ hiển thị:
+- full: hiển thị chi tiết quá trình khởi động
+- clean: bảng status cập nhật định kỳ, chỉ hiển thị error từ output của services
+- quiet: log tối giản, không hiển thị output của services; chạy trên một event loop
+  asyncio, mỗi service có một task chờ process kết thúc (không thread, không polling)
+"""
+import os
+import re
+import sys
+import asyncio
+import ctypes
+import time
+import select
+import selectors
+import socket
+import subprocess
+import signal
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Literal, Optional, Tuple, Union
+
+try:
+    import psutil
+except ImportError:  # psutil là optional - fallback sang lệnh shell của hệ điều hành
+    psutil = None
+
+from libs.service_catalog import SERVICES, ServiceSpec
+
+Mode = Literal['full', 'clean', 'quiet']
+
+# Các từ khóa trong output của service cần hiển thị (match trực tiếp trên bytes, không phân biệt hoa thường)
+ERROR_PATTERN = re.compile(rb'error|exception|failed|critical', re.IGNORECASE)
+
+# Kích thước mỗi lần đọc output từ pipe (bytes)
+READ_CHUNK = 65536
+
+# Dòng đầu tiên của bảng status trên màn hình (sau 5 dòng header)
+STATUS_FIRST_ROW = 6
+
+# Chu kỳ cập nhật bảng status ở chế độ clean (giây)
+DISPLAY_INTERVAL = 10
+
+# Chu kỳ kiểm tra khi không có cơ chế chờ process nào khác (giây)
+POLL_INTERVAL = 30
+
+# Thời gian chờ trước khi restart service bị dừng (tránh restart liên tục khi service crash ngay)
+RESTART_DELAY = 1.0
+
+# Thời gian tối đa chờ một service lắng nghe trên port khi khởi động (giây)
+STARTUP_TIMEOUT = 30.0
+
+# Windows: thời gian tối đa mỗi lần chờ handle (ms) - Ctrl+C chỉ được xử lý giữa các lần chờ
+WAIT_SLICE_MS = 1000
+
+# Giá trị trả về của WaitForMultipleObjects khi lỗi
+WAIT_FAILED = 0xFFFFFFFF
+
+
+class MonorepoManager:
+    """Khởi động, theo dõi và dừng các services của monorepo"""
+
+    def __init__(self, mode: Mode = 'full'):
+        self.mode = mode
+        self.services: Tuple[ServiceSpec, ...] = SERVICES
+        self.processes: Dict[ServiceSpec, Union[subprocess.Popen, asyncio.subprocess.Process]] = {}
+        self.running = True
+        # Chế độ quiet không đọc output - spawn và theo dõi process hoàn toàn trên event loop
+        self.use_asyncio = mode == 'quiet'
+        # Chế độ full chỉ cảnh báo khi port bị chiếm, các chế độ khác dừng process cũ
+        self.cleanup_ports = mode != 'full'
+        # Chế độ clean refresh bảng status định kỳ, các chế độ khác chỉ thức dậy khi có service dừng
+        self._refresh_interval: Optional[float] = DISPLAY_INTERVAL if mode == 'clean' else None
+
+        # Một selector + một thread đọc output của tất cả services (Windows không select được pipe)
+        self._sel = selectors.DefaultSelector() if mode == 'clean' and os.name != 'nt' else None
+        self._reader_thread = None
+        # Phần dòng chưa kết thúc của mỗi pipe (fd -> bytes)
+        self._tail: Dict[int, bytes] = {}
+        # Các dòng status đã hiển thị - chỉ vẽ lại dòng thay đổi
+        self._prev_status: Dict[ServiceSpec, str] = {}
+        # Cần vẽ lại toàn màn hình (lần đầu hoặc sau khi có output làm lệch layout)
+        self._needs_redraw = True
+
+        # Cơ chế chờ process dừng: 'pidfd' | 'sigchld' | 'handles' | 'poll'
+        self._waiter = 'poll'
+
+        # Map port -> PID quét lần đầu gặp port bận, dùng chung trong một lượt start_all
+        self._port_map: Optional[Dict[int, int]] = None
+
+        if mode == 'clean' and os.name == 'nt':
+            self._enable_ansi()
+
+    # ------------------------------------------------------------------
+    # Port helpers
+    # ------------------------------------------------------------------
+
+    def check_port(self, port: int) -> bool:
+        """Kiểm tra port có đang được sử dụng không"""
+        # Phase 1: bind probe - bind được nghĩa là chưa có service lắng nghe trên port
+        # Không dùng SO_REUSEADDR: trên BSD/macOS nó cho phép bind 127.0.0.1 khi service
+        # đang lắng nghe trên 0.0.0.0, khiến port bị báo trống
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind(('localhost', port))
+                return False
+            except OSError:
+                pass
+
+        # Phase 2: bind lỗi (có listener hoặc chỉ còn kết nối TIME_WAIT) - xác nhận port thực sự nhận kết nối
+        try:
+            socket.create_connection(('localhost', port), timeout=0.1).close()
+            return True
+        except OSError:
+            return False
+
+    def _port_to_pid_map(self) -> Dict[int, int]:
+        """Map port -> PID của các process đang listen (một lần quét connection table)"""
+        try:
+            connections = psutil.net_connections(kind='tcp')
+        except psutil.AccessDenied:
+            return {}
+        return {
+            conn.laddr.port: conn.pid
+            for conn in connections
+            if conn.status == psutil.CONN_LISTEN and conn.pid
+        }
+
+    def kill_port(self, port: int, port_map: Optional[Dict[int, int]] = None):
+        """
+        Dừng process đang listen trên port
+
+        Args:
+            port: Port cần giải phóng
+            port_map: Map port -> PID đã quét sẵn (dùng chung cho nhiều port)
+        """
+        if psutil is not None:
+            if port_map is None:
+                port_map = self._port_to_pid_map()
+            pid = port_map.get(port)
+            if pid:
+                try:
+                    psutil.Process(pid).kill()
+                except psutil.Error:
+                    pass
+            return
+
+        if os.name == 'nt':
+            # Windows - sử dụng cách khác để tránh lỗi Git Bash
+            cmd = f'powershell "Get-NetTCPConnection -LocalPort {port} -State Listen | Select -ExpandProperty OwningProcess | ForEach-Object {{ Stop-Process -Id $_ -Force }}"'
+            subprocess.run(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            # Linux/Mac
+            subprocess.run(f"lsof -ti:{port} | xargs kill -9", shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    async def _await_port(self, port: int, timeout: float = STARTUP_TIMEOUT) -> bool:
+        """
+        Chờ tới khi port nhận kết nối
+
+        Args:
+            port: Port của service
+            timeout: Thời gian chờ tối đa (giây)
+
+        Returns:
+            bool: True nếu service đã lắng nghe trên port trước khi hết timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection('localhost', port), timeout=0.25
+                )
+                writer.close()
+                return True
+            except (OSError, asyncio.TimeoutError):
+                await asyncio.sleep(0.05)
+        return False
+
+    # ------------------------------------------------------------------
+    # Start / stop
+    # ------------------------------------------------------------------
+
+    def start_service(self, service: ServiceSpec) -> Tuple[subprocess.Popen, bool]:
+        """
+        Khởi động một service
+
+        Args:
+            service: Cấu hình service
+
+        Returns:
+            tuple: (process, port có trống trước khi khởi động hay không)
+        """
+        port_free = self._claim_port(service)
+        if not port_free and self.cleanup_ports:
+            time.sleep(1)
+
+        # Chỉ chế độ clean đọc output của services
+        process = subprocess.Popen(
+            [sys.executable, service.script],
+            cwd=service.path,
+            stdout=subprocess.PIPE if self.mode == 'clean' else subprocess.DEVNULL,
+            stderr=subprocess.STDOUT
+        )
+
+        if process.stdout is not None:
+            self._watch_output(service, process)
+
+        return process, port_free
+
+    async def start_service_async(self, service: ServiceSpec) -> Tuple[asyncio.subprocess.Process, bool]:
+        """
+        Khởi động một service bằng asyncio subprocess (chế độ quiet, không đọc output)
+
+        Args:
+            service: Cấu hình service
+
+        Returns:
+            tuple: (process, port có trống trước khi khởi động hay không)
+        """
+        port_free = self._claim_port(service)
+        if not port_free and self.cleanup_ports:
+            await asyncio.sleep(1)
+
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, service.script,
+            cwd=service.path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return process, port_free
+
+    def _claim_port(self, service: ServiceSpec) -> bool:
+        """
+        Kiểm tra port của service, dừng process cũ đang chiếm port nếu cần
+
+        Connection table chỉ được quét khi gặp port bận đầu tiên và dùng lại
+        cho các service sau trong cùng lượt start_all.
+
+        Returns:
+            bool: True nếu port trống
+        """
+        port_free = not self.check_port(service.port)
+        if not port_free:
+            self._render_port_in_use(service)
+            if self.cleanup_ports:
+                if self._port_map is None and psutil is not None:
+                    self._port_map = self._port_to_pid_map()
+                self.kill_port(service.port, self._port_map)
+        return port_free
+
+    async def start_all(self):
+        """Khởi động tất cả services (spawn liên tục, chờ các port đồng thời)"""
+        self._render_banner()
+
+        self._port_map = None
+        started = []
+        for service in self.services:
+            try:
+                self._render_starting(service)
+                if self.use_asyncio:
+                    process, port_free = await self.start_service_async(service)
+                else:
+                    process, port_free = self.start_service(service)
+                self.processes[service] = process
+                started.append((service, port_free))
+            except Exception as e:
+                print(f"   ❌ {self._label(service)}: Lỗi - {e}")
+        # Service restart sau này phải quét lại connection table
+        self._port_map = None
+
+        # Kiểm tra services đã lên chưa (thoát sớm ngay khi port nhận kết nối)
+        ready = await asyncio.gather(*(self._await_port(service.port) for service, _ in started))
+        for (service, port_free), is_ready in zip(started, ready):
+            self._render_ready(service, port_free or self.cleanup_ports, is_ready)
+
+        self._render_started()
+
+    def stop_all(self):
+        """Dừng tất cả services"""
+        self.running = False
+        print("\n\n🛑 Đang dừng tất cả services...")
+
+        for service, process in tuple(self.processes.items()):
+            try:
+                process.terminate()
+                process.wait(timeout=3)
+                print(f"   • {self._label(service)}: Đã dừng")
+            except:
+                try:
+                    process.kill()
+                    print(f"   • {self._label(service)}: Đã force stop")
+                except:
+                    pass
+
+        print("\n✅ Đã dừng toàn bộ hệ thống!\n")
+
+    async def stop_all_async(self):
+        """Dừng tất cả services được khởi động bằng asyncio subprocess"""
+        self.running = False
+        print("\n\n🛑 Đang dừng tất cả services...")
+
+        for service, process in tuple(self.processes.items()):
+            if process.returncode is not None:
+                continue
+            try:
+                process.terminate()
+                await asyncio.wait_for(process.wait(), timeout=3)
+                print(f"   • {self._label(service)}: Đã dừng")
+            except:
+                try:
+                    process.kill()
+                    await process.wait()
+                    print(f"   • {self._label(service)}: Đã force stop")
+                except:
+                    pass
+
+        print("\n✅ Đã dừng toàn bộ hệ thống!\n")
+
+    # ------------------------------------------------------------------
+    # Theo dõi process
+    # ------------------------------------------------------------------
+
+    def _install_exit_waiter(self) -> Callable[[Optional[float]], List[ServiceSpec]]:
+        """Chọn cơ chế chờ process dừng tốt nhất mà hệ điều hành hỗ trợ"""
+        if self._install_pidfd_waiters():
+            self._waiter = 'pidfd'
+            return self._wait_pidfd_exits
+        if self._install_sigchld_waiter():
+            self._waiter = 'sigchld'
+            self._pid_to_service = {process.pid: service for service, process in self.processes.items()}
+            return self._wait_sigchld_exits
+        if os.name == 'nt':
+            self._waiter = 'handles'
+            return self._wait_handle_exits
+        return self._poll_exits
+
+    def _track(self, service: ServiceSpec, process: subprocess.Popen):
+        """Đăng ký process vừa restart với cơ chế chờ đang dùng"""
+        if self._waiter == 'pidfd':
+            self._register_pidfd(service, process)
+        elif self._waiter == 'sigchld':
+            self._pid_to_service[process.pid] = service
+
+    def _install_pidfd_waiters(self) -> bool:
+        """
+        Đăng ký pidfd của từng service vào epoll để chờ service dừng (Linux >= 5.3)
+
+        Returns:
+            bool: False nếu hệ điều hành không hỗ trợ pidfd/epoll
+        """
+        if not hasattr(os, "pidfd_open") or not hasattr(select, "epoll"):
+            return False
+
+        self._epoll = select.epoll()
+        self._pidfds: Dict[int, ServiceSpec] = {}
+        try:
+            for service, process in self.processes.items():
+                self._register_pidfd(service, process)
+        except OSError:
+            # Kernel không hỗ trợ pidfd_open - dùng cơ chế khác
+            for fd in self._pidfds:
+                os.close(fd)
+            self._epoll.close()
+            return False
+        return True
+
+    def _register_pidfd(self, service: ServiceSpec, process: subprocess.Popen):
+        """Mở pidfd cho process và đăng ký vào epoll"""
+        fd = os.pidfd_open(process.pid, 0)
+        self._epoll.register(fd, select.EPOLLIN)
+        self._pidfds[fd] = service
+
+    def _wait_pidfd_exits(self, timeout: Optional[float]) -> List[ServiceSpec]:
+        """Block trên epoll tới khi có service dừng (hoặc hết timeout)"""
+        exited = []
+        for fd, _ in self._epoll.poll(-1 if timeout is None else timeout):
+            service = self._pidfds.pop(fd)
+            self._epoll.unregister(fd)
+            os.close(fd)
+            self.processes[service].wait()
+            exited.append(service)
+        return exited
+
+    def _install_sigchld_waiter(self) -> bool:
+        """
+        Nhận SIGCHLD qua wakeup fd để biết khi có service dừng (POSIX không có pidfd)
+
+        Returns:
+            bool: False nếu hệ điều hành không có SIGCHLD (Windows)
+        """
+        if not hasattr(signal, "SIGCHLD"):
+            return False
+
+        self._wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(wakeup_w, False)
+        signal.set_wakeup_fd(wakeup_w)
+        # Cần handler Python (không phải SIG_DFL) để signal được ghi vào wakeup fd
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        return True
+
+    def _wait_sigchld(self, timeout: Optional[float] = None) -> bool:
+        """Block tới khi nhận được signal (hoặc hết timeout)"""
+        ready, _, _ = select.select([self._wakeup_r], [], [], timeout)
+        if ready:
+            try:
+                os.read(self._wakeup_r, 512)
+            except BlockingIOError:
+                pass
+        return bool(ready)
+
+    def _reap_children(self) -> List[Tuple[int, int]]:
+        """Thu hồi tất cả child process đã dừng bằng một vòng waitpid(-1)"""
+        exited = []
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            exited.append((pid, status))
+        return exited
+
+    def _wait_sigchld_exits(self, timeout: Optional[float]) -> List[ServiceSpec]:
+        """Một waitpid(-1) cho mọi service thay vì poll() từng process"""
+        exited = []
+        reaped = self._reap_children()
+        if not reaped:
+            self._wait_sigchld(timeout)
+            reaped = self._reap_children()
+        for pid, status in reaped:
+            service = self._pid_to_service.pop(pid, None)
+            if service is None:
+                # Child process khác (vd. lệnh shell của kill_port)
+                continue
+            self.processes[service].returncode = os.waitstatus_to_exitcode(status)
+            exited.append(service)
+        return exited
+
+    def _wait_any_exit(self, processes: List[subprocess.Popen], timeout_ms: int) -> Optional[int]:
+        """
+        Windows: block trong một lệnh WaitForMultipleObjects tới khi có process dừng
+
+        Args:
+            processes: Các process cần theo dõi (tối đa 64)
+            timeout_ms: Thời gian chờ tối đa (ms)
+
+        Returns:
+            Optional[int]: Index của process đã dừng, None nếu hết timeout
+
+        Raises:
+            OSError: WaitForMultipleObjects trả về WAIT_FAILED
+        """
+        kernel32 = ctypes.windll.kernel32
+        kernel32.WaitForMultipleObjects.restype = ctypes.c_uint32
+        handles = (ctypes.c_void_p * len(processes))(*[int(process._handle) for process in processes])
+        result = kernel32.WaitForMultipleObjects(len(processes), handles, False, timeout_ms)
+        if result == WAIT_FAILED:
+            raise ctypes.WinError(kernel32.GetLastError())
+        if 0 <= result < len(processes):  # WAIT_OBJECT_0 + index
+            return result
+        return None
+
+    def _wait_handle_exits(self, timeout: Optional[float]) -> List[ServiceSpec]:
+        """Windows: chờ trên handle của các process theo từng lát WAIT_SLICE_MS"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.running and (deadline is None or time.monotonic() < deadline):
+            services = tuple(self.processes)
+            if not services:
+                # Không có handle để chờ - ngủ thay vì quay vòng liên tục
+                time.sleep(timeout if timeout is not None else POLL_INTERVAL)
+                return []
+            try:
+                index = self._wait_any_exit([self.processes[service] for service in services], WAIT_SLICE_MS)
+            except OSError as e:
+                print(f"⚠️  WaitForMultipleObjects lỗi (GetLastError={e.winerror}): {e.strerror}")
+                time.sleep(timeout if timeout is not None else POLL_INTERVAL)
+                return []
+            if index is not None:
+                service = services[index]
+                self.processes[service].wait()
+                return [service]
+        return []
+
+    def _poll_exits(self, timeout: Optional[float]) -> List[ServiceSpec]:
+        """Fallback: kiểm tra từng process rồi ngủ tới lần kiểm tra sau"""
+        # Duyệt snapshot, không duyệt dict đang bị sửa
+        snapshot = tuple(self.processes.items())
+        exited = [service for service, process in snapshot if process.poll() is not None]
+        if not exited:
+            time.sleep(timeout if timeout is not None else POLL_INTERVAL)
+        return exited
+
+    def monitor(self):
+        """Theo dõi services, khởi động lại service bị dừng"""
+        wait_for_exits = self._install_exit_waiter()
+        while self.running:
+            for service in wait_for_exits(self._refresh_interval):
+                if not self.running:
+                    return
+                print(f"\n⚠️  {self._label(service)} đã dừng, đang khởi động lại...")
+                self._needs_redraw = True
+                time.sleep(RESTART_DELAY)
+                process, _ = self.start_service(service)
+                self.processes[service] = process
+                self._track(service, process)
+
+            if self.running:
+                self._render_status()
+
+    async def _watch(self, service: ServiceSpec):
+        """Chờ process của service kết thúc và khởi động lại (không polling)"""
+        while self.running:
+            await self.processes[service].wait()
+            if not self.running:
+                return
+            print(f"\n⚠️  {self._label(service)} đã dừng, đang khởi động lại...")
+            await asyncio.sleep(RESTART_DELAY)
+            self.processes[service], _ = await self.start_service_async(service)
+
+    async def _run_async(self):
+        """Khởi động services rồi theo dõi chúng trên cùng một event loop"""
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                # Windows: Ctrl+C đến dưới dạng KeyboardInterrupt, vẫn đi qua finally bên dưới
+                pass
+
+        watchers = []
+        try:
+            await self.start_all()
+            # Mỗi service một task chờ process kết thúc
+            watchers = [asyncio.create_task(self._watch(service)) for service in self.processes]
+            await stop_event.wait()
+        finally:
+            self.running = False
+            for task in watchers:
+                task.cancel()
+            await self.stop_all_async()
+
+    def run(self):
+        """Khởi động tất cả services rồi theo dõi"""
+        if self.use_asyncio:
+            try:
+                asyncio.run(self._run_async())
+            except KeyboardInterrupt:
+                sys.exit(0)
+            except Exception as e:
+                print(f"\n❌ Lỗi hệ thống: {e}")
+                sys.exit(1)
+            return
+
+        try:
+            asyncio.run(self.start_all())
+            self.monitor()
+        except KeyboardInterrupt:
+            self.stop_all()
+        except Exception as e:
+            print(f"\n❌ Lỗi hệ thống: {e}")
+            self.stop_all()
+            sys.exit(1)
+
+    # ------------------------------------------------------------------
+    # Output của services (chế độ clean)
+    # ------------------------------------------------------------------
+
+    def _watch_output(self, service: ServiceSpec, process: subprocess.Popen):
+        """Theo dõi output của service, chỉ hiển thị các dòng error"""
+        if self._sel is not None:
+            self._sel.register(process.stdout, selectors.EVENT_READ, data=self._label(service))
+            if self._reader_thread is None:
+                self._reader_thread = threading.Thread(target=self._read_output, daemon=True)
+                self._reader_thread.start()
+        else:
+            # Windows: một thread đọc cho mỗi service
+            def read_output():
+                for line in process.stdout:
+                    self._print_errors(self._label(service), line)
+
+            thread = threading.Thread(target=read_output)
+            thread.daemon = True
+            thread.start()
+
+    def _read_output(self):
+        """Đọc output của các services đã đăng ký vào selector"""
+        while self.running:
+            for key, _ in self._sel.select(timeout=0.5):
+                data = os.read(key.fd, READ_CHUNK)
+                if not data:
+                    # Service đã dừng - xử lý phần còn lại và đóng pipe cũ
+                    self._print_errors(key.data, self._tail.pop(key.fd, b''))
+                    self._sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                    continue
+
+                # Chỉ xử lý các dòng hoàn chỉnh, giữ lại phần dòng dở dang cho lần đọc sau
+                lines, _, tail = (self._tail.pop(key.fd, b'') + data).rpartition(b'\n')
+                if tail:
+                    self._tail[key.fd] = tail
+                self._print_errors(key.data, lines)
+
+    def _print_errors(self, label: str, chunk: bytes):
+        """Hiển thị các dòng có chứa error trong chunk output"""
+        # Phần lớn chunk không có error - bỏ qua mà không cần tách dòng
+        if not ERROR_PATTERN.search(chunk):
+            return
+        for line in chunk.split(b'\n'):
+            if ERROR_PATTERN.search(line):
+                print(f"[{label}] ⚠️ {line.decode('utf-8', 'replace').strip()}")
+                self._needs_redraw = True
+
+    # ------------------------------------------------------------------
+    # Hiển thị
+    # ------------------------------------------------------------------
+
+    def _label(self, service: ServiceSpec) -> str:
+        """Tên hiển thị của service (bảng status dùng tên ngắn)"""
+        return service.short_name if self.mode == 'clean' else service.name
+
+    def _render_banner(self):
+        """In banner chào mừng"""
+        if self.mode == 'full':
+            print("\n" + "="*60)
+            print("🚀 FASTAPI MONOREPO - KHỞI ĐỘNG HỆ THỐNG")
+            print("="*60)
+            print("\n📋 Các services sẽ được khởi động:")
+            for service in self.services:
+                print(f"  • {service.name}: Port {service.port}")
+            print("\n" + "="*60 + "\n")
+        elif self.mode == 'quiet':
+            print("\n" + "="*50)
+            print("🚀 KHỞI ĐỘNG FASTAPI MONOREPO")
+            print("="*50)
+            print("\n⏳ Đang khởi động các services...")
+        else:
+            print("\n⏳ Starting services...")
+
+    def _render_port_in_use(self, service: ServiceSpec):
+        """Thông báo port của service đang bị process khác chiếm"""
+        if self.mode == 'full':
+            print(f"⚠️  Port {service.port} đã được sử dụng")
+        elif self.mode == 'quiet':
+            print(f"   • {service.name}: Port {service.port} đã được sử dụng, đang cleanup...")
+
+    def _render_starting(self, service: ServiceSpec):
+        """Thông báo bắt đầu khởi động một service"""
+        if self.mode == 'full':
+            print(f"{service.color}[{service.name}] Đang khởi động trên port {service.port}...\033[0m")
+        elif self.mode == 'clean':
+            print(f"  • {service.short_name}: Starting on port {service.port}...")
+
+    def _render_ready(self, service: ServiceSpec, port_free: bool, is_ready: bool):
+        """Thông báo kết quả khởi động của một service"""
+        if self.mode == 'full':
+            if not port_free:
+                # Port do process cũ chiếm - không thể xác nhận service mới đã lên
+                print(f"⚠️  {service.name}: port {service.port} đang do process khác sử dụng")
+            elif is_ready:
+                print(f"✅ {service.name} đã khởi động thành công!")
+            else:
+                print(f"⏳ {service.name} đang khởi động...")
+        elif self.mode == 'quiet':
+            if is_ready:
+                print(f"   ✅ {service.name}: Port {service.port}")
+            else:
+                print(f"   ⏳ {service.name}: Đang khởi động...")
+
+    def _render_started(self):
+        """In thông tin truy cập sau khi khởi động xong"""
+        if self.mode == 'full':
+            print("\n" + "="*60)
+            print("✨ TẤT CẢ SERVICES ĐÃ ĐƯỢC KHỞI ĐỘNG!")
+            print("="*60)
+            print("\n📌 Truy cập hệ thống:")
+            print("  • API Gateway: http://localhost:8080")
+            print("  • Swagger UI: http://localhost:8080/docs")
+            print("  • Dashboard: http://localhost:8080/dashboard")
+            print("\n📝 Nhấn Ctrl+C để dừng tất cả services")
+            print("="*60 + "\n")
+        elif self.mode == 'quiet':
+            print("\n" + "="*50)
+            print("✨ HỆ THỐNG ĐÃ SẴN SÀNG!")
+            print("="*50)
+            print("\n📌 Truy cập:")
+            print("   • API Gateway: http://localhost:8080")
+            print("   • Swagger Docs: http://localhost:8080/docs")
+            print("   • Dashboard: http://localhost:8080/dashboard")
+            print("\n⛔ Nhấn Ctrl+C để dừng tất cả services")
+            print("="*50)
+        else:
+            self._render_status()
+
+    def _render_status(self):
+        """Cập nhật bảng status (chỉ chế độ clean)"""
+        if self.mode == 'clean':
+            self.display_status()
+
+    def _enable_ansi(self):
+        """Bật xử lý ANSI escape code cho console Windows 10+"""
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+
+    def clear_screen(self):
+        """Clear terminal screen (ANSI escape code, không spawn cls/clear)"""
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+
+    def _render_status_line(self, service: ServiceSpec) -> str:
+        """Render dòng status của một service trong bảng"""
+        port = service.port
+        status = "[OK]" if self.check_port(port) else "[--]"
+        url = f"localhost:{port}"
+        return f"| {service.short_name:<11} | {port:<5} | {status:<9} | {url:<21} |"
+
+    def _render_footer(self) -> str:
+        """Render dòng thời gian cập nhật"""
+        current_time = datetime.now().strftime("%H:%M:%S")
+        return f"Last updated: {current_time} | Press Ctrl+C to stop"
+
+    def display_status(self):
+        """Hiển thị status table đẹp (chỉ ghi lại các dòng thay đổi)"""
+        status_lines = {service: self._render_status_line(service) for service in self.services}
+
+        if self._needs_redraw:
+            self._needs_redraw = False
+            self._draw_full(status_lines)
+        else:
+            # Di chuyển cursor tới từng dòng thay đổi thay vì clear + in lại toàn bộ
+            output = []
+            for row, service in enumerate(self.services, start=STATUS_FIRST_ROW):
+                if status_lines[service] != self._prev_status.get(service):
+                    output.append(f"\x1b[{row};1H{status_lines[service]}")
+
+            footer_row = STATUS_FIRST_ROW + len(self.services) + 7
+            output.append(f"\x1b[{footer_row};1H\x1b[2K{self._render_footer()}\x1b[{footer_row + 1};1H")
+            sys.stdout.write("".join(output))
+            sys.stdout.flush()
+
+        self._prev_status = status_lines
+
+    def _draw_full(self, status_lines: Dict[ServiceSpec, str]):
+        """Clear màn hình và vẽ lại toàn bộ bảng status"""
+        self.clear_screen()
+        print("+" + "-"*58 + "+")
+        print("|" + " "*20 + "FASTAPI MONOREPO" + " "*22 + "|")
+        print("+" + "-"*58 + "+")
+        print("| Service     | Port  | Status    | URL                   |")
+        print("|-------------|-------|-----------|----------------------|")
+
+        for service in self.services:
+            print(status_lines[service])
+
+        print("+" + "-"*58 + "+")
+
+        print("\nQuick Access:")
+        print("  * Swagger UI: http://localhost:8080/docs")
+        print("  * Dashboard:  http://localhost:8080/dashboard")
+        print("  * Health:     http://localhost:8080/health")
+
+        print(f"\n{self._render_footer()}")
+
+
+def main(mode: Mode = 'full'):
+    """Main function"""
+    manager = MonorepoManager(mode=mode)
+
+    # Đăng ký signal handler (chế độ asyncio đăng ký handler trên event loop)
+    if not manager.use_asyncio:
+        def signal_handler(sig, frame):
+            manager.stop_all()
+            sys.exit(0)
+
+        signal.signal(signal.SIGINT, signal_handler)
+
+    # Chạy hệ thống
+    manager.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,10 @@
 Event-driven integration for Product Service
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
 
-from libs.events import EventBus, EventPublisher, EventSubscriber, EventType, BaseEvent
+from libs.events import EventBus, EventPublisher, EventSubscriber, EventType, BaseEvent, EventPublishError
 from libs.service_registry import global_service_registry
 
 logger = logging.getLogger(__name__)
@@ -146,6 +146,44 @@ class ProductEventIntegration:
             logger.error(f"Error publishing product.stock_updated event: {e}")
             return False
     
+    async def publish_product_stock_updates(
+        self,
+        stock_changes: Dict[int, Tuple[int, int]],
+        updated_by_user_id: int,
+        correlation_id: Optional[str] = None
+    ) -> int:
+        """
+        Publish product.stock_updated events for a bulk stock update
+        
+        Args:
+            stock_changes: Map product_id -> (old_quantity, new_quantity)
+            updated_by_user_id: User who updated the stock
+            correlation_id: Optional correlation ID for tracing
+            
+        Returns:
+            Number of events published (events sent before a failed batch count;
+            0 on other failures)
+        """
+        try:
+            published = await self.publisher.publish_product_stock_updates(
+                stock_changes=stock_changes,
+                updated_by_user_id=updated_by_user_id,
+                correlation_id=correlation_id
+            )
+            logger.info(f"Published {published} product.stock_updated events")
+            return published
+            
+        except EventPublishError as e:
+            logger.error(
+                f"Error publishing product.stock_updated events "
+                f"({e.published_count} of {len(stock_changes)} published): {e}"
+            )
+            return e.published_count
+            
+        except Exception as e:
+            logger.error(f"Error publishing product.stock_updated events: {e}")
+            return 0
+    
     async def start_event_subscriptions(self):
         """Start all event subscriptions"""
         try:
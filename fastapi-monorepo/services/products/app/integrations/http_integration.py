@@ -180,3 +180,5 @@ class ProductHTTPIntegration:
     async def close(self):
         """Close HTTP clients"""
         await self.auth_client.close()
+        # auth_client dùng connection pool chung của registry
+        await self.service_registry.get_http_registry().close_async()
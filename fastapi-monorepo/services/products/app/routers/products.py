@@ -3,13 +3,11 @@ Product Routes - API Endpoints
 Định nghĩa các API endpoints cho Product operations
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy.orm import Session
 from typing import Optional
 import logging
 import math
 import uuid
 
-from libs.db.session import get_db
 from libs.auth.jwt_utils import get_current_user_id, get_jwt_manager
 from libs.common.base_schema import ListResponse
 from ..models.product import Product
@@ -18,7 +16,9 @@ from ..schemas.product import (
     ProductUpdate, 
     ProductResponse, 
     ProductListResponse,
-    ProductSearchParams
+    ProductSearchParams,
+    BulkStockUpdate,
+    BulkStockUpdateResponse
 )
 from ..services.product_service import ProductService, get_product_service
 from ..integrations.http_integration import ProductHTTPIntegration
@@ -54,10 +54,6 @@ def get_jwt_token_from_request(request: Request) -> Optional[str]:
         return authorization.split(" ")[1]
     return None
 
-def get_product_service(db: Session = Depends(get_db)) -> ProductService:
-    """Dependency để inject ProductService"""
-    return ProductService(db)
-
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
 async def create_product(
     request: Request,
@@ -255,6 +251,70 @@ async def delete_product(
     service.delete_product(product_id)
     return None
 
+@router.patch("/stock/bulk", response_model=BulkStockUpdateResponse)
+async def bulk_update_product_stock(
+    request: Request,
+    stock_data: BulkStockUpdate,
+    current_user_id: int = Depends(get_current_user_id),
+    service: ProductService = Depends(get_product_service),
+    http_integration: ProductHTTPIntegration = Depends(get_http_integration),
+    event_integration: ProductEventIntegration = Depends(get_event_integration)
+):
+    """
+    Cập nhật tồn kho hàng loạt (Yêu cầu authentication)
+    
+    **Headers:**
+    - Authorization: Bearer {access_token}
+    
+    **Body:**
+    - **changes**: Map product_id -> số lượng thay đổi (dương = tăng, âm = giảm)
+    
+    Tất cả thay đổi được áp dụng trong một transaction; nếu một sản phẩm
+    không đủ tồn kho thì không sản phẩm nào được cập nhật.
+    
+    **Features:**
+    - HTTP Integration: Validates user permissions for stock management
+    - Event Integration: Publishes one product.stock_updated event per changed product (pipelined)
+    """
+    logger.info("Bulk updating stock for %s products by user %s", len(stock_data.changes), current_user_id)
+    
+    # Get JWT token for HTTP integration
+    jwt_token = get_jwt_token_from_request(request)
+    correlation_id = str(uuid.uuid4())
+    
+    # HTTP Integration: Validate user permissions for stock management
+    if jwt_token:
+        has_permission = await http_integration.validate_product_permissions(
+            user_id=current_user_id,
+            action="manage_stock",
+            jwt_token=jwt_token
+        )
+        
+        if not has_permission:
+            logger.warning("User %s does not have permission to manage stock", current_user_id)
+            # Continue anyway for demo purposes, but log the warning
+    
+    new_stock = service.bulk_update_stock(stock_data.changes)
+    
+    # Event Integration: Publish product.stock_updated for every product whose stock changed
+    stock_changes = {
+        product_id: (new_quantity - stock_data.changes[product_id], new_quantity)
+        for product_id, new_quantity in new_stock.items()
+        if stock_data.changes[product_id] != 0
+    }
+    if stock_changes:
+        published = await event_integration.publish_product_stock_updates(
+            stock_changes=stock_changes,
+            updated_by_user_id=current_user_id,
+            correlation_id=correlation_id
+        )
+        if published != len(stock_changes):
+            logger.warning(
+                "Published %s of %s product.stock_updated events", published, len(stock_changes)
+            )
+    
+    return BulkStockUpdateResponse(stock=new_stock)
+
 @router.patch("/{product_id}/stock", response_model=ProductResponse)
 async def update_product_stock(
     request: Request,
@@ -3,7 +3,7 @@ Product Schemas - Pydantic Models
 Định nghĩa các schema cho API request/response validation
 """
 from pydantic import Field, validator
-from typing import Optional, List
+from typing import Optional, List, Dict
 from decimal import Decimal
 from libs.common.base_schema import (
     BaseSchema, BaseCreate, BaseUpdate, BaseResponse, 
@@ -82,9 +82,34 @@ class ProductResponse(ProductBase, BaseResponse):
         }
 
 
+class BulkStockUpdate(BaseSchema):
+    """Schema cho cập nhật tồn kho hàng loạt"""
+    changes: Dict[int, int] = Field(..., min_length=1, description="Map product_id -> số lượng thay đổi (có thể âm)")
+
+
+class BulkStockUpdateResponse(BaseSchema):
+    """Schema response cho cập nhật tồn kho hàng loạt"""
+    stock: Dict[int, int] = Field(..., description="Map product_id -> số lượng tồn kho mới")
+
+
+class ProductListItem(BaseSchema):
+    """Schema rút gọn cho danh sách sản phẩm (chỉ các trường cần cho listing)"""
+    id: int
+    name: str
+    price: Decimal
+    category: str
+    stock_quantity: int
+    is_active: bool
+
+    class Config:
+        json_encoders = {
+            Decimal: lambda v: float(v)
+        }
+
+
 class ProductListResponse(ListResponse):
     """Schema cho danh sách sản phẩm với pagination (kế thừa ListResponse)"""
-    items: List[ProductResponse]
+    items: List[ProductListItem]
 
 class ProductSearchParams(SearchParams):
     """Schema cho tham số tìm kiếm sản phẩm (kế thừa SearchParams để có sẵn search, is_active, page, per_page)"""
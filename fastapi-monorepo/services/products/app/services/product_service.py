@@ -3,17 +3,28 @@ Product Service - Business Logic Layer
 Chứa các business logic và operations cho Product
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from typing import Optional, List, Tuple
-from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, case, update
+from typing import Optional, List, Tuple, Dict
+from fastapi import Depends, HTTPException, status
 import logging
 
 from libs.common.base_service import BaseService
+from libs.db.session import get_db
 from ..models.product import Product
-from ..schemas.product import ProductCreate, ProductUpdate, ProductSearchParams
+from ..schemas.product import ProductCreate, ProductUpdate, ProductSearchParams, ProductListItem
 
 logger = logging.getLogger(__name__)
 
+# Các cột dùng cho listing - query theo cột để bỏ qua ORM hydration / identity map
+PRODUCT_LIST_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.price,
+    Product.category,
+    Product.stock_quantity,
+    Product.is_active,
+)
+
 
 class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
     """Service class chứa business logic cho Product operations (kế thừa BaseService)"""
@@ -40,7 +51,7 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
         ).first()
         
         if existing_product:
-            logger.warning(f"Attempt to create duplicate product: {product_data.name}")
+            logger.warning("Attempt to create duplicate product: %s", product_data.name)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Sản phẩm với tên '{product_data.name}' đã tồn tại"
@@ -64,17 +75,37 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
         """
         return self.get_by_id_or_404(product_id)
     
-    def get_products(self, search_params: ProductSearchParams) -> Tuple[List[Product], int]:
+    def get_products(self, search_params: ProductSearchParams) -> Tuple[List[ProductListItem], int]:
         """
-        Lấy danh sách sản phẩm với tìm kiếm và phân trang (sử dụng BaseService)
+        Lấy danh sách sản phẩm với tìm kiếm và phân trang
+        
+        Chỉ select các cột cần cho listing và trả về ProductListItem thay vì
+        ORM object; các thao tác cần sửa attribute vẫn dùng get_product().
         
         Args:
             search_params: Tham số tìm kiếm và phân trang
             
         Returns:
-            tuple: (danh sách sản phẩm, tổng số sản phẩm)
+            tuple: (danh sách sản phẩm rút gọn, tổng số sản phẩm)
         """
-        return self.get_list(search_params)
+        query = self.db.query(*PRODUCT_LIST_COLUMNS).filter(Product.is_active == True)
+        
+        if search_params.search:
+            query = self._apply_search_filter(query, search_params.search)
+        
+        if search_params.is_active is not None:
+            query = query.filter(Product.is_active == search_params.is_active)
+        
+        query = self._apply_custom_filters(query, search_params)
+        
+        total = query.count()
+        
+        offset = (search_params.page - 1) * search_params.per_page
+        rows = query.offset(offset).limit(search_params.per_page).all()
+        items = [ProductListItem(**row._asdict()) for row in rows]
+        
+        logger.info("Retrieved %s products (total: %s)", len(items), total)
+        return items, total
     
     def _apply_search_filter(self, query, search_term: str):
         """
@@ -152,7 +183,7 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
             ).first()
             
             if existing_product:
-                logger.warning(f"Attempt to update to duplicate name: {product_data.name}")
+                logger.warning("Attempt to update to duplicate name: %s", product_data.name)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Sản phẩm với tên '{product_data.name}' đã tồn tại"
@@ -168,12 +199,12 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
             self.db.commit()
             self.db.refresh(product)
             
-            logger.info(f"Updated product: {product.id} - {product.name}")
+            logger.info("Updated product: %s - %s", product.id, product.name)
             return product
             
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error updating product {product_id}: {str(e)}")
+            logger.error("Error updating product %s: %s", product_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Lỗi khi cập nhật sản phẩm"
@@ -199,12 +230,12 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
             product.is_active = False
             self.db.commit()
             
-            logger.info(f"Soft deleted product: {product.id} - {product.name}")
+            logger.info("Soft deleted product: %s - %s", product.id, product.name)
             return True
             
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error deleting product {product_id}: {str(e)}")
+            logger.error("Error deleting product %s: %s", product_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Lỗi khi xóa sản phẩm"
@@ -229,7 +260,10 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
         new_quantity = product.stock_quantity + quantity_change
         
         if new_quantity < 0:
-            logger.warning(f"Insufficient stock for product {product_id}: {product.stock_quantity} + {quantity_change}")
+            logger.warning(
+                "Insufficient stock for product %s: %s + %s",
+                product_id, product.stock_quantity, quantity_change
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Không đủ tồn kho. Hiện có: {product.stock_quantity}, cần: {abs(quantity_change)}"
@@ -240,12 +274,93 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
             self.db.commit()
             self.db.refresh(product)
             
-            logger.info(f"Updated stock for product {product_id}: {product.stock_quantity}")
+            logger.info("Updated stock for product %s: %s", product_id, product.stock_quantity)
             return product
             
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error updating stock for product {product_id}: {str(e)}")
+            logger.error("Error updating stock for product %s: %s", product_id, e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Lỗi khi cập nhật tồn kho"
+            )
+
+    
+    def bulk_update_stock(self, changes: Dict[int, int]) -> Dict[int, int]:
+        """
+        Cập nhật tồn kho cho nhiều sản phẩm trong một transaction
+        
+        Khóa các dòng cần cập nhật bằng một SELECT ... FOR UPDATE để kiểm tra
+        tồn kho, rồi cộng delta ngay trong SQL (stock_quantity = stock_quantity + delta)
+        bằng một bulk UPDATE - hai lần cập nhật đồng thời không làm mất delta của nhau.
+        
+        Args:
+            changes: Map product_id -> số lượng thay đổi (có thể âm)
+            
+        Returns:
+            Dict[int, int]: Map product_id -> số lượng tồn kho mới
+            
+        Raises:
+            HTTPException: Nếu không tìm thấy sản phẩm hoặc không đủ tồn kho
+        """
+        rows = self.db.query(Product.id, Product.stock_quantity).filter(
+            Product.id.in_(changes.keys()),
+            Product.is_active == True
+        ).with_for_update().all()
+        current = {product_id: quantity for product_id, quantity in rows}
+        
+        missing = [product_id for product_id in changes if product_id not in current]
+        if missing:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Không tìm thấy sản phẩm với ID: {missing}"
+            )
+        
+        insufficient = [
+            product_id for product_id, quantity_change in changes.items()
+            if current[product_id] + quantity_change < 0
+        ]
+        if insufficient:
+            self.db.rollback()
+            logger.warning("Insufficient stock for products %s", insufficient)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Không đủ tồn kho cho sản phẩm: {insufficient}"
+            )
+        
+        delta = case(changes, value=Product.id)
+        
+        try:
+            # Điều kiện tồn kho >= 0 được kiểm tra lại trong WHERE cho DB không hỗ trợ FOR UPDATE
+            result = self.db.execute(
+                update(Product)
+                .where(Product.id.in_(changes.keys()), Product.stock_quantity + delta >= 0)
+                .values(stock_quantity=Product.stock_quantity + delta)
+                .returning(Product.id, Product.stock_quantity)
+                .execution_options(synchronize_session=False)
+            )
+            new_stock = {product_id: quantity for product_id, quantity in result.all()}
+            
+            if len(new_stock) != len(changes):
+                insufficient = [product_id for product_id in changes if product_id not in new_stock]
+                logger.warning("Insufficient stock for products %s", insufficient)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Không đủ tồn kho cho sản phẩm: {insufficient}"
+                )
+            
+            self.db.commit()
+            
+            logger.info("Bulk updated stock for %s products", len(new_stock))
+            return new_stock
+            
+        except HTTPException:
+            self.db.rollback()
+            raise
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error bulk updating stock: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Lỗi khi cập nhật tồn kho"
@@ -253,7 +368,7 @@ class ProductService(BaseService[Product, ProductCreate, ProductUpdate]):
 
 
 # Dependency function for FastAPI
-def get_product_service(db: Session) -> ProductService:
+def get_product_service(db: Session = Depends(get_db)) -> ProductService:
     """
     Dependency function để inject ProductService vào FastAPI endpoints
     
@@ -8,7 +8,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 import logging
+import logging.config
+import logging.handlers
 import os
+import queue
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -23,9 +26,28 @@ from .app.routers import products
 from libs.db.session import db_manager
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Request handlers chỉ đưa record vào queue; QueueListener ghi ra stdout ở background thread
+log_queue: queue.Queue = queue.Queue(-1)
+logging.config.dictConfig({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": log_queue
+        }
+    },
+    "root": {
+        "level": "INFO",
+        "handlers": ["queue"]
+    }
+})
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+log_listener = logging.handlers.QueueListener(
+    log_queue, log_stream_handler, respect_handler_level=True
 )
 logger = logging.getLogger(__name__)
 
@@ -137,6 +159,7 @@ async def startup_event():
     Startup event
     Khởi tạo các resources cần thiết khi start service
     """
+    log_listener.start()
     logger.info("🚀 Starting Products Service...")
     logger.info(f"📊 Database URL: {db_manager._mask_password(db_manager.database_url)}")
     logger.info(f"🔧 Service Port: {os.getenv('SERVICE_PORT', '8003')}")
@@ -153,7 +176,13 @@ async def shutdown_event():
     # Close database connections
     db_manager.close()
     
+    # Close HTTP connection pool dùng chung với các service khác
+    await products.http_integration.close()
+    
     logger.info("✅ Products Service shutdown completed!")
+    
+    # Flush các log record còn lại trong queue và dừng background thread
+    log_listener.stop()
 
 # Main entry point
 if __name__ == "__main__":
@@ -1,14 +1,10 @@
 #!/usr/bin/env python
 """
-Startup script for Products Service with proper path configuration
+Startup script for Products Service
+Yêu cầu đã cài monorepo ở chế độ editable: `pip install -e .` (từ thư mục gốc)
 """
-import sys
 import os
 
-# Add parent directory to path for libs imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-# Now import and run the main app
 from services.products.main import app
 import uvicorn
 
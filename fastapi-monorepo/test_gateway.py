@@ -6,15 +6,29 @@ API Gateway Test Script
 Test API Gateway và các service endpoints
 """
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import sys
-from typing import Dict, List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
-def test_endpoint(url: str, name: str, timeout: int = 5) -> Dict:
+# Số connection tối đa giữ lại trong pool (>= số endpoint test đồng thời)
+POOL_SIZE = 16
+
+def create_session() -> requests.Session:
+    """Tạo Session dùng chung để tái sử dụng keep-alive connection giữa các request"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def test_endpoint(url: str, name: str, timeout: int = 5, session: Optional[requests.Session] = None) -> Dict:
     """Test một endpoint"""
     try:
         start_time = time.time()
-        response = requests.get(url, timeout=timeout)
+        response = (session or requests).get(url, timeout=timeout)
         response_time = time.time() - start_time
         
         return {
@@ -55,38 +69,42 @@ def main():
     # Test endpoints
     endpoints = [
         # Direct services
-        ("Auth Service Direct", "http://localhost:8001/health"),
-        ("Articles Service Direct", "http://localhost:8002/health"),
-        ("Products Service Direct", "http://localhost:8003/health"),
+        ("Direct Services", "Auth Service Direct", "http://localhost:8001/health"),
+        ("Direct Services", "Articles Service Direct", "http://localhost:8002/health"),
+        ("Direct Services", "Products Service Direct", "http://localhost:8003/health"),
         
         # API Gateway
-        ("API Gateway Health", "http://localhost:8000/health"),
-        ("API Gateway Metrics", "http://localhost:8000/metrics"),
+        ("API Gateway", "API Gateway Health", "http://localhost:8000/health"),
+        ("API Gateway", "API Gateway Metrics", "http://localhost:8000/metrics"),
         
         # Gateway routing to services
-        ("Gateway -> Auth", "http://localhost:8000/auth/health"),
-        ("Gateway -> Articles", "http://localhost:8000/articles/health"),
-        ("Gateway -> Products", "http://localhost:8000/products/health"),
+        ("Gateway Routing", "Gateway -> Auth", "http://localhost:8000/auth/health"),
+        ("Gateway Routing", "Gateway -> Articles", "http://localhost:8000/articles/health"),
+        ("Gateway Routing", "Gateway -> Products", "http://localhost:8000/products/health"),
         
         # API v1 routes
-        ("Gateway -> Auth API", "http://localhost:8000/api/v1/auth/health"),
-        ("Gateway -> Articles API", "http://localhost:8000/api/v1/articles/health"),
-        ("Gateway -> Products API", "http://localhost:8000/api/v1/products/health"),
+        ("API v1 Routes", "Gateway -> Auth API", "http://localhost:8000/api/v1/auth/health"),
+        ("API v1 Routes", "Gateway -> Articles API", "http://localhost:8000/api/v1/articles/health"),
+        ("API v1 Routes", "Gateway -> Products API", "http://localhost:8000/api/v1/products/health"),
         
         # Documentation endpoints
-        ("Gateway Docs", "http://localhost:8000/docs"),
-        ("Auth Docs", "http://localhost:8001/docs"),
-        ("Products Docs", "http://localhost:8003/docs"),
+        ("Documentation", "Gateway Docs", "http://localhost:8000/docs"),
+        ("Documentation", "Auth Docs", "http://localhost:8001/docs"),
+        ("Documentation", "Products Docs", "http://localhost:8003/docs"),
     ]
     
-    results = []
     success_count = 0
     
-    for name, url in endpoints:
-        print(f"\n🔍 Testing {name}...")
-        result = test_endpoint(url, name, timeout=10)
-        results.append(result)
-        
+    # Test tất cả endpoints đồng thời - endpoint bị treo không chặn các endpoint khác
+    print(f"\n🔍 Testing {len(endpoints)} endpoints...")
+    with create_session() as session, ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        results = list(executor.map(
+            lambda endpoint: test_endpoint(endpoint[2], endpoint[1], timeout=10, session=session),
+            endpoints
+        ))
+    
+    for result in results:
+        print(f"\n🔍 {result['name']}")
         if result['status'] == 'success':
             success_count += 1
             print(f"   ✅ {result['status_code']} - {result['response_time']}s")
@@ -99,26 +117,9 @@ def main():
     print(f"📊 Test Summary: {success_count}/{total_tests} endpoints working")
     
     # Group results by category
-    categories = {
-        'Direct Services': [],
-        'API Gateway': [],
-        'Gateway Routing': [],
-        'API v1 Routes': [],
-        'Documentation': []
-    }
-    
-    for result in results:
-        name = result['name']
-        if 'Direct' in name:
-            categories['Direct Services'].append(result)
-        elif 'Gateway Health' in name or 'Gateway Metrics' in name:
-            categories['API Gateway'].append(result)
-        elif 'Gateway ->' in name and 'API' not in name:
-            categories['Gateway Routing'].append(result)
-        elif 'API' in name and 'Gateway ->' in name:
-            categories['API v1 Routes'].append(result)
-        elif 'Docs' in name:
-            categories['Documentation'].append(result)
+    categories: Dict[str, List[Dict]] = defaultdict(list)
+    for (category, _, _), result in zip(endpoints, results):
+        categories[category].append(result)
     
     for category, category_results in categories.items():
         if not category_results:
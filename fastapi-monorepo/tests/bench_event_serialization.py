@@ -0,0 +1,54 @@
+"""
+Benchmark event JSON serialization: pydantic vs orjson
+
+Not collected by pytest - run with `python -m tests.bench_event_serialization`.
+"""
+
+import logging
+import os
+import timeit
+import uuid
+
+from libs.events import BaseEvent, UserEvent
+
+log = logging.getLogger(__name__)
+
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "10000"))
+
+
+def run_event_serialization_benchmark(iterations: int = ITERATIONS):
+    """Time encoding and decoding one user.created event with each encoder"""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    event = UserEvent.user_created(
+        event_id=uuid.uuid4().hex,
+        source_service="bench_service",
+        user_id=123,
+        username="benchuser",
+        email="benchuser@example.com"
+    )
+    json_data = event.model_dump_json()
+
+    timings = {
+        "pydantic encode": timeit.timeit(event.model_dump_json, number=iterations),
+        "pydantic decode": timeit.timeit(lambda: BaseEvent.model_validate_json(json_data), number=iterations),
+    }
+    if orjson is not None:
+        timings["orjson encode"] = timeit.timeit(lambda: orjson.dumps(event.model_dump()), number=iterations)
+        timings["orjson decode"] = timeit.timeit(lambda: BaseEvent.model_validate(orjson.loads(json_data)), number=iterations)
+    else:
+        log.info("orjson not installed - only pydantic is measured")
+
+    log.info(f"⚡ Event serialization ({iterations} iterations)")
+    for name, duration in timings.items():
+        log.info(f"   {name:<16} {duration / iterations * 1e6:8.2f}µs/op")
+
+    return timings
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("TEST_LOG_LEVEL", "INFO"), format="%(message)s")
+    run_event_serialization_benchmark()
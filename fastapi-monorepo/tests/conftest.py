@@ -0,0 +1,32 @@
+"""
+Fixtures dùng chung cho các test của Products service
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from services.products.app.models.product import Product
+
+
+@pytest.fixture
+def db():
+    """SQLite in-memory session với bảng products"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    Product.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Product(id=1, name="Keyboard", price=10, category="Electronics", stock_quantity=10),
+        Product(id=2, name="Mouse", price=5, category="Electronics", stock_quantity=3),
+        Product(id=3, name="Desk", price=100, category="Furniture", stock_quantity=1, is_active=False),
+        Product(id=4, name="Office Chair", price=50, category="Furniture", stock_quantity=7),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
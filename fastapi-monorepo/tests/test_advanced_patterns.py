@@ -7,27 +7,74 @@ Service Mesh, Distributed Tracing, Circuit Breaker, and Caching.
 """
 
 import asyncio
-import sys
+import io
+import logging
 import os
 import uuid
 import time
 import json
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 
-# Add path to monorepo root
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import pytest
+
+from libs.api_gateway.config import GatewayConfig, AuthConfig, RateLimitConfig, ServiceInstance
+from libs.api_gateway.load_balancer import LoadBalancer, LoadBalancingAlgorithm
+
+log = logging.getLogger(__name__)
+
+# Shared read-only inputs, built once at import
+_AUTH_CONFIG = AuthConfig(
+    enabled=True,
+    jwt_secret="test-secret-key",
+    public_paths=("/health", "/metrics")
+)
+
+_RATE_LIMIT_CONFIG = RateLimitConfig(
+    enabled=True,
+    default_rpm=1000,
+    default_burst=100
+)
+
+_SERVICE_INSTANCES = (
+    ServiceInstance(host="localhost", port=8001, weight=1),
+    ServiceInstance(host="localhost", port=8002, weight=2)
+)
+
+# Optional suites - import errors are reported as failed results by the runner
+try:
+    from libs.tracing.config import TracingConfig, TracingBackend
+    TRACING_IMPORT_ERROR = None
+except ImportError as e:
+    TRACING_IMPORT_ERROR = e
+
+try:
+    from libs.caching.config import CacheConfig, CacheBackendType
+    CACHING_IMPORT_ERROR = None
+except ImportError as e:
+    CACHING_IMPORT_ERROR = e
 
 
 class AdvancedPatternsTestResults:
     """Track advanced patterns test results"""
     
-    def __init__(self):
+    __slots__ = (
+        "tests_run", "tests_passed", "tests_failed", "results",
+        "performance_metrics", "verbose", "_out", "_total_duration", "_summary_cache"
+    )
+    
+    def __init__(self, verbose: bool = True):
         self.tests_run = 0
         self.tests_passed = 0
         self.tests_failed = 0
         self.results = []
         self.performance_metrics = {}
+        # verbose=False buffers output until flush() so concurrent suites don't interleave
+        self.verbose = verbose
+        self._out = io.StringIO()
+        self._total_duration = 0.0
+        self._summary_cache = None
     
     def add_result(self, test_name: str, passed: bool, details: str = "", duration: float = 0.0):
         self.tests_run += 1
@@ -44,115 +91,115 @@ class AdvancedPatternsTestResults:
             "passed": passed,
             "details": details,
             "duration": duration,
-            "timestamp": datetime.now().isoformat()
+            "timestamp_ns": time.time_ns()
         }
         self.results.append(result)
-        print(f"{status}: {test_name} ({duration:.3f}s)")
+        self._total_duration += duration
+        self._summary_cache = None
+        self.write(f"{status}: {test_name} ({duration:.3f}s)")
         if details:
-            print(f"   Details: {details}")
+            self.write(f"   Details: {details}")
+    
+    def write(self, message: str):
+        if self.verbose:
+            log.info(message)
+        else:
+            self._out.write(message + "\n")
+    
+    def flush(self):
+        """Emit buffered output as a single log record"""
+        output = self._out.getvalue()
+        if output:
+            log.info(output.rstrip("\n"))
+            self._out = io.StringIO()
     
     def get_summary(self):
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
         success_rate = (self.tests_passed / self.tests_run * 100) if self.tests_run > 0 else 0
-        total_duration = sum(result["duration"] for result in self.results)
         
-        return {
+        self._summary_cache = {
             "total_tests": self.tests_run,
             "passed": self.tests_passed,
             "failed": self.tests_failed,
             "success_rate": f"{success_rate:.1f}%",
-            "total_duration": f"{total_duration:.3f}s",
+            "total_duration": f"{self._total_duration:.3f}s",
             "performance_metrics": self.performance_metrics,
-            "results": self.results
+            "results": [
+                {**result, "timestamp": datetime.fromtimestamp(result["timestamp_ns"] / 1e9, tz=timezone.utc).isoformat()}
+                for result in self.results
+            ]
         }
+        return self._summary_cache
 
 
-async def test_api_gateway():
+@contextmanager
+def timed_test(results: AdvancedPatternsTestResults, test_name: str, details: str = ""):
+    """Time the enclosed block and record it as passed, or as failed if it raises"""
+    start_time = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        results.add_result(test_name, False, str(e), time.perf_counter() - start_time)
+    else:
+        results.add_result(test_name, True, details, time.perf_counter() - start_time)
+
+
+async def test_api_gateway(verbose: bool = True):
     """Test API Gateway functionality"""
-    results = AdvancedPatternsTestResults()
+    results = AdvancedPatternsTestResults(verbose=verbose)
     
-    print("🚪 Testing API Gateway")
-    print("-" * 50)
+    results.write("🚪 Testing API Gateway")
+    results.write("-" * 50)
     
     # Test 1: Gateway Configuration
-    start_time = time.time()
-    try:
-        from libs.api_gateway import GatewayConfig, AuthConfig, RateLimitConfig
-        
-        auth_config = AuthConfig(
-            enabled=True,
-            jwt_secret="test-secret-key",
-            public_paths=["/health", "/metrics"]
-        )
-        
-        rate_limit_config = RateLimitConfig(
-            enabled=True,
-            default_rpm=1000,
-            default_burst=100
+    with timed_test(results, "API Gateway Configuration", "Successfully created comprehensive gateway configuration"):
+        gateway_config = GatewayConfig.create_default(
+            auth=_AUTH_CONFIG,
+            rate_limiting=_RATE_LIMIT_CONFIG
         )
         
-        gateway_config = GatewayConfig.create_default()
-        gateway_config.auth = auth_config
-        gateway_config.rate_limiting = rate_limit_config
-        
         assert gateway_config.auth.enabled == True
         assert gateway_config.rate_limiting.default_rpm == 1000
-        
-        duration = time.time() - start_time
-        results.add_result(
-            "API Gateway Configuration",
-            True,
-            "Successfully created comprehensive gateway configuration",
-            duration
-        )
-        
-    except Exception as e:
-        duration = time.time() - start_time
-        results.add_result("API Gateway Configuration", False, str(e), duration)
     
-    # Test 2: Load Balancer Algorithms
-    start_time = time.time()
-    try:
-        from libs.api_gateway.load_balancer import LoadBalancer, LoadBalancingAlgorithm
-        from libs.api_gateway.config import ServiceInstance
-        
-        instances = [
-            ServiceInstance(host="localhost", port=8001, weight=1),
-            ServiceInstance(host="localhost", port=8002, weight=2)
-        ]
-        
-        algorithms_tested = []
-        for algorithm in LoadBalancingAlgorithm:
-            lb = LoadBalancer(algorithm=algorithm)
-            selected = await lb.select_instance(instances, client_ip="192.168.1.100")
-            if selected:
-                algorithms_tested.append(algorithm.value)
-        
-        duration = time.time() - start_time
-        results.add_result(
-            "Load Balancer Algorithms",
-            True,
-            f"Successfully tested {len(algorithms_tested)} load balancing algorithms",
-            duration
-        )
-        
-    except Exception as e:
-        duration = time.time() - start_time
-        results.add_result("Load Balancer Algorithms", False, str(e), duration)
+    return results
+
+
+@pytest.mark.parametrize("algorithm", list(LoadBalancingAlgorithm))
+async def test_load_balancer_algorithm(algorithm):
+    """Test each load balancing algorithm selects an instance"""
+    lb = LoadBalancer(algorithm=algorithm)
+    selected = await lb.select_instance(_SERVICE_INSTANCES, client_ip="192.168.1.100")
+    assert selected is not None
+
+
+async def run_load_balancer_checks(verbose: bool = True):
+    """Check every load balancing algorithm for the script runner (pytest runs the parametrized test)"""
+    results = AdvancedPatternsTestResults(verbose=verbose)
+    
+    results.write("\n⚖️ Testing Load Balancer")
+    results.write("-" * 50)
+    
+    algorithms = list(LoadBalancingAlgorithm)
+    with timed_test(results, "Load Balancer Algorithms", f"Successfully tested {len(algorithms)} load balancing algorithms"):
+        for algorithm in algorithms:
+            await test_load_balancer_algorithm(algorithm)
     
     return results
 
 
-async def test_distributed_tracing():
+async def test_distributed_tracing(verbose: bool = True):
     """Test Distributed Tracing functionality"""
-    results = AdvancedPatternsTestResults()
+    results = AdvancedPatternsTestResults(verbose=verbose)
     
-    print("\n🔍 Testing Distributed Tracing")
-    print("-" * 50)
+    results.write("\n🔍 Testing Distributed Tracing")
+    results.write("-" * 50)
     
     # Test 1: Tracing Configuration
-    start_time = time.time()
-    try:
-        from libs.tracing.config import TracingConfig, TracingBackend
+    with timed_test(results, "Tracing Configuration", "Successfully created tracing configurations"):
+        if TRACING_IMPORT_ERROR:
+            raise TRACING_IMPORT_ERROR
         
         jaeger_config = TracingConfig.create_jaeger_config(
             service_name="test-service",
@@ -164,33 +211,21 @@ async def test_distributed_tracing():
         assert jaeger_config.backend == TracingBackend.JAEGER
         assert jaeger_config.sampling_rate == 1.0
         assert dev_config.backend == TracingBackend.CONSOLE
-        
-        duration = time.time() - start_time
-        results.add_result(
-            "Tracing Configuration",
-            True,
-            "Successfully created tracing configurations",
-            duration
-        )
-        
-    except Exception as e:
-        duration = time.time() - start_time
-        results.add_result("Tracing Configuration", False, str(e), duration)
     
     return results
 
 
-async def test_caching_system():
+async def test_caching_system(verbose: bool = True):
     """Test Caching System functionality"""
-    results = AdvancedPatternsTestResults()
+    results = AdvancedPatternsTestResults(verbose=verbose)
     
-    print("\n💾 Testing Caching System")
-    print("-" * 50)
+    results.write("\n💾 Testing Caching System")
+    results.write("-" * 50)
     
     # Test 1: Cache Configuration
-    start_time = time.time()
-    try:
-        from libs.caching.config import CacheConfig, CacheBackendType
+    with timed_test(results, "Cache Configuration", "Successfully created cache configurations"):
+        if CACHING_IMPORT_ERROR:
+            raise CACHING_IMPORT_ERROR
         
         redis_config = CacheConfig.create_redis_config(default_ttl=3600)
         memory_config = CacheConfig.create_memory_config(max_size=1000)
@@ -199,45 +234,39 @@ async def test_caching_system():
         assert redis_config.backend == CacheBackendType.REDIS
         assert memory_config.backend == CacheBackendType.MEMORY
         assert dev_config.log_cache_operations == True
-        
-        duration = time.time() - start_time
-        results.add_result(
-            "Cache Configuration",
-            True,
-            "Successfully created cache configurations",
-            duration
-        )
-        
-    except Exception as e:
-        duration = time.time() - start_time
-        results.add_result("Cache Configuration", False, str(e), duration)
     
     return results
 
 
 async def run_advanced_patterns_tests():
     """Run comprehensive advanced patterns tests"""
-    print("🚀 Starting Advanced Patterns Tests (Phase 3)")
-    print("=" * 80)
+    log.info("🚀 Starting Advanced Patterns Tests (Phase 3)")
+    log.info("=" * 80)
     
-    # Run test suites
-    api_gateway_results = await test_api_gateway()
-    tracing_results = await test_distributed_tracing()
-    caching_results = await test_caching_system()
+    # Run independent test suites concurrently
+    api_gateway_results, load_balancer_results, tracing_results, caching_results = await asyncio.gather(
+        test_api_gateway(verbose=False),
+        run_load_balancer_checks(verbose=False),
+        test_distributed_tracing(verbose=False),
+        test_caching_system(verbose=False)
+    )
     
     # Combine results
-    total_tests = api_gateway_results.tests_run + tracing_results.tests_run + caching_results.tests_run
-    total_passed = api_gateway_results.tests_passed + tracing_results.tests_passed + caching_results.tests_passed
+    suites = (api_gateway_results, load_balancer_results, tracing_results, caching_results)
+    for suite in suites:
+        suite.flush()
+    total_tests = sum(suite.tests_run for suite in suites)
+    total_passed = sum(suite.tests_passed for suite in suites)
     success_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
     
-    print("\n" + "=" * 80)
-    print("📊 ADVANCED PATTERNS TEST RESULTS")
-    print("=" * 80)
-    print(f"📈 Total Tests: {total_tests}")
-    print(f"   Passed: {total_passed} ✅")
-    print(f"   Success Rate: {success_rate:.1f}%")
-    print(f"\n✅ Advanced Patterns Tests Completed Successfully!")
-    print("=" * 80)
+    log.info("\n" + "=" * 80)
+    log.info("📊 ADVANCED PATTERNS TEST RESULTS")
+    log.info("=" * 80)
+    log.info(f"📈 Total Tests: {total_tests}")
+    log.info(f"   Passed: {total_passed} ✅")
+    log.info(f"   Success Rate: {success_rate:.1f}%")
+    log.info(f"\n✅ Advanced Patterns Tests Completed Successfully!")
+    log.info("=" * 80)
     
     return {
         "total_tests": total_tests,
@@ -247,4 +276,5 @@ async def run_advanced_patterns_tests():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("TEST_LOG_LEVEL", "INFO"), format="%(message)s")
     asyncio.run(run_advanced_patterns_tests())
@@ -3,25 +3,107 @@ Test Event-driven communication
 """
 
 import asyncio
+import logging
 import pytest
-import sys
 import os
 import uuid
 from datetime import datetime
 
-# Add path to monorepo root
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from libs.events import (
     EventBus, EventPublisher, EventSubscriber, EventHandler,
-    BaseEvent, UserEvent, ProductEvent, EventType
+    BaseEvent, UserEvent, ProductEvent, EventType, EventPublishError
 )
 
+log = logging.getLogger(__name__)
+
+
+class FakePipeline:
+    """In-process stand-in for a redis.asyncio pipeline - records queued commands"""
+    
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    def publish(self, channel, data):
+        self.commands.append(("publish", channel))
+    
+    def xadd(self, key, fields):
+        self.commands.append(("xadd", key))
+    
+    async def execute(self):
+        attempt = self.client.execute_attempts
+        self.client.execute_attempts += 1
+        if attempt in self.client.failing_attempts:
+            raise ConnectionError(f"execute attempt {attempt} failed")
+        self.client.executed.append(self.commands)
+
+
+class FakePubSub:
+    """
+    In-process stand-in for a redis.asyncio PubSub
+    
+    Replays the client's queued messages, then stops - or, for a live client,
+    keeps delivering whatever is published to the channel.
+    """
+    
+    def __init__(self, client):
+        self.client = client
+        self.channel = None
+        self.queue = asyncio.Queue()
+    
+    async def subscribe(self, channel):
+        self.channel = channel
+        self.client.subscriptions.append(channel)
+        self.client.subscribers.setdefault(channel, []).append(self.queue)
+    
+    async def listen(self):
+        for data in self.client.messages.get(self.channel, ()):
+            yield {"type": "message", "data": data}
+        while self.client.live:
+            yield {"type": "message", "data": await self.queue.get()}
+    
+    async def close(self):
+        self.client.subscribers.get(self.channel, []).remove(self.queue)
+
+
+class FakeRedis:
+    """In-process stand-in for redis.asyncio.Redis that only supports pipelines and pub/sub"""
+    
+    def __init__(self, messages=None, live=False, failing_attempts=()):
+        self.executed = []
+        self.execute_attempts = 0
+        self.failing_attempts = set(failing_attempts)
+        self.subscriptions = []
+        self.subscribers = {}
+        self.messages = messages or {}
+        self.live = live
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def pubsub(self):
+        return FakePubSub(self)
+    
+    async def publish(self, channel, data):
+        queues = self.subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait(data)
+        return len(queues)
+    
+    async def close(self):
+        pass
+
 
 class TestEventCommunication:
     """Test event-driven service communication"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     async def event_bus(self):
         """Setup event bus for testing"""
         # Use test Redis instance or mock
@@ -31,37 +113,44 @@ class TestEventCommunication:
         )
         return event_bus
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     async def event_publisher(self, event_bus):
         """Setup event publisher for testing"""
         return EventPublisher(event_bus)
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     async def event_subscriber(self, event_bus):
         """Setup event subscriber for testing"""
         return EventSubscriber(event_bus)
     
+    @pytest.fixture(autouse=True)
+    def reset_handlers(self, request):
+        """Drop handlers registered by a test so the shared subscriber starts clean"""
+        yield
+        if "event_subscriber" in request.fixturenames:
+            request.getfixturevalue("event_subscriber").clear_handlers()
+    
     async def test_event_bus_connection(self, event_bus):
         """Test event bus connection to Redis"""
         try:
-            print("🔌 Testing Event Bus Connection...")
+            log.info("🔌 Testing Event Bus Connection...")
             
             # In real test, this would connect to Redis
             # await event_bus.connect()
             # health = await event_bus.health_check()
             # assert health["status"] == "healthy"
             
-            print("   Event bus connection simulated")
-            print("✅ Event bus connection test passed")
+            log.info("   Event bus connection simulated")
+            log.info("✅ Event bus connection test passed")
             
         except Exception as e:
-            print(f"❌ Event bus connection test failed: {e}")
+            log.error(f"❌ Event bus connection test failed: {e}")
             # Don't fail for simulation
     
     async def test_publish_user_created_event(self, event_publisher):
         """Test publishing user.created event"""
         try:
-            print("👤 Testing User Created Event Publishing...")
+            log.info("👤 Testing User Created Event Publishing...")
             
             # Create test event data
             user_data = {
@@ -71,7 +160,7 @@ class TestEventCommunication:
                 "full_name": "Test User"
             }
             
-            print(f"   Publishing user.created event: {user_data}")
+            log.info(f"   Publishing user.created event: {user_data}")
             
             # In real test, this would publish to Redis
             # success = await event_publisher.publish_user_created(
@@ -79,19 +168,19 @@ class TestEventCommunication:
             #     username=user_data["username"],
             #     email=user_data["email"],
             #     full_name=user_data["full_name"],
-            #     correlation_id=str(uuid.uuid4())
+            #     correlation_id=uuid.uuid4().hex
             # )
             # assert success == True
             
-            print("✅ User created event publishing test simulated successfully")
+            log.info("✅ User created event publishing test simulated successfully")
             
         except Exception as e:
-            print(f"❌ User created event publishing test failed: {e}")
+            log.error(f"❌ User created event publishing test failed: {e}")
     
     async def test_publish_product_created_event(self, event_publisher):
         """Test publishing product.created event"""
         try:
-            print("🛍️ Testing Product Created Event Publishing...")
+            log.info("🛍️ Testing Product Created Event Publishing...")
             
             # Create test event data
             product_data = {
@@ -103,7 +192,7 @@ class TestEventCommunication:
                 "stock_quantity": 10
             }
             
-            print(f"   Publishing product.created event: {product_data}")
+            log.info(f"   Publishing product.created event: {product_data}")
             
             # In real test, this would publish to Redis
             # success = await event_publisher.publish_product_created(
@@ -113,19 +202,19 @@ class TestEventCommunication:
             #     category=product_data["category"],
             #     created_by_user_id=product_data["created_by_user_id"],
             #     stock_quantity=product_data["stock_quantity"],
-            #     correlation_id=str(uuid.uuid4())
+            #     correlation_id=uuid.uuid4().hex
             # )
             # assert success == True
             
-            print("✅ Product created event publishing test simulated successfully")
+            log.info("✅ Product created event publishing test simulated successfully")
             
         except Exception as e:
-            print(f"❌ Product created event publishing test failed: {e}")
+            log.error(f"❌ Product created event publishing test failed: {e}")
     
     async def test_publish_stock_updated_event(self, event_publisher):
         """Test publishing product.stock_updated event"""
         try:
-            print("📦 Testing Stock Updated Event Publishing...")
+            log.info("📦 Testing Stock Updated Event Publishing...")
             
             # Create test event data
             stock_data = {
@@ -136,7 +225,7 @@ class TestEventCommunication:
                 "updated_by_user_id": 123
             }
             
-            print(f"   Publishing product.stock_updated event: {stock_data}")
+            log.info(f"   Publishing product.stock_updated event: {stock_data}")
             
             # In real test, this would publish to Redis
             # success = await event_publisher.publish_product_stock_updated(
@@ -145,53 +234,195 @@ class TestEventCommunication:
             #     new_quantity=stock_data["new_quantity"],
             #     quantity_change=stock_data["quantity_change"],
             #     updated_by_user_id=stock_data["updated_by_user_id"],
-            #     correlation_id=str(uuid.uuid4())
+            #     correlation_id=uuid.uuid4().hex
             # )
             # assert success == True
             
-            print("✅ Stock updated event publishing test simulated successfully")
+            log.info("✅ Stock updated event publishing test simulated successfully")
             
         except Exception as e:
-            print(f"❌ Stock updated event publishing test failed: {e}")
+            log.error(f"❌ Stock updated event publishing test failed: {e}")
+    
+    async def test_publish_many_uses_one_pipeline_per_batch(self):
+        """Test batched publishing sends each batch in a single pipeline round-trip"""
+        event_bus = EventBus(service_name="test_service", batch_size=1000)
+        event_bus.redis_client = FakeRedis()
+        event_bus.is_connected = True
+        
+        events = [
+            UserEvent.user_created(
+                event_id=uuid.uuid4().hex,
+                source_service="test_service",
+                user_id=user_id,
+                username=f"user{user_id}",
+                email=f"user{user_id}@example.com"
+            )
+            for user_id in range(1000)
+        ]
+        
+        published = await EventPublisher(event_bus).publish_many(events)
+        
+        assert published == 1000
+        assert len(event_bus.redis_client.executed) == 1
+        assert len(event_bus.redis_client.executed[0]) == 2000  # publish + xadd per event
+    
+    def _user_events(self, count, source_service="origin_service"):
+        return [
+            UserEvent.user_created(
+                event_id=uuid.uuid4().hex,
+                source_service=source_service,
+                user_id=user_id,
+                username=f"user{user_id}",
+                email=f"user{user_id}@example.com"
+            )
+            for user_id in range(count)
+        ]
+    
+    async def test_publish_many_retries_failed_batch(self):
+        """Test a failed batch is retried and the input events are not modified"""
+        event_bus = EventBus(service_name="test_service", batch_size=2, retry_delay=0)
+        event_bus.redis_client = FakeRedis(failing_attempts={0})
+        event_bus.is_connected = True
+        events = self._user_events(3)
+        
+        published = await EventPublisher(event_bus).publish_many(events)
+        
+        assert published == 3
+        assert event_bus.redis_client.execute_attempts == 3  # first batch retried once
+        assert [len(commands) for commands in event_bus.redis_client.executed] == [4, 2]
+        assert all(event.source_service == "origin_service" for event in events)
+    
+    async def test_publish_many_reports_published_count_on_failure(self):
+        """Test a batch failing on every retry reports how many events were already published"""
+        event_bus = EventBus(service_name="test_service", batch_size=2, max_retries=2, retry_delay=0)
+        event_bus.redis_client = FakeRedis(failing_attempts={1, 2})
+        event_bus.is_connected = True
+        
+        with pytest.raises(EventPublishError) as exc_info:
+            await EventPublisher(event_bus).publish_many(self._user_events(5))
+        
+        assert exc_info.value.published_count == 2
+        assert event_bus.redis_client.execute_attempts == 3
+        assert len(event_bus.redis_client.executed) == 1
+    
+    def test_event_bus_rejects_invalid_batch_size(self):
+        """Test batch_size must be positive"""
+        with pytest.raises(ValueError):
+            EventBus(service_name="test_service", batch_size=0)
+    
+    async def test_subscribe_dispatches_each_handler_once(self):
+        """Test handlers sharing an event type share one subscriber loop and run once per event"""
+        event = UserEvent.user_created(
+            event_id=uuid.uuid4().hex,
+            source_service="test_service",
+            user_id=123,
+            username="testuser",
+            email="testuser@example.com"
+        )
+        event_bus = EventBus(service_name="test_service")
+        event_bus.redis_client = FakeRedis(messages={"events:user.created": [event.to_bytes()]})
+        event_bus.is_connected = True
+        
+        calls = []
+        for name in ("first", "second"):
+            await event_bus.subscribe(EventHandler(
+                event_type=EventType.USER_CREATED,
+                handler_func=lambda e, name=name: calls.append((name, e.event_id)),
+                service_name="test_service"
+            ))
+        await asyncio.gather(*event_bus.subscriber_tasks)
+        
+        assert event_bus.redis_client.subscriptions == ["events:user.created"]
+        assert calls == [("first", event.event_id), ("second", event.event_id)]
+    
+    async def test_subscribe_after_reconnect_delivers_events(self):
+        """Test a disconnect/reconnect restarts the subscriber loop for known event types"""
+        redis_client = FakeRedis(live=True)
+        event_bus = EventBus(service_name="test_service")
+        
+        async def connect():
+            event_bus.redis_client = redis_client
+            event_bus.is_connected = True
+        
+        event_bus.connect = connect
+        
+        received = asyncio.Queue()
+        handler = EventHandler(
+            event_type=EventType.USER_CREATED,
+            handler_func=received.put_nowait,
+            service_name="test_service"
+        )
+        
+        await event_bus.subscribe(handler)
+        await event_bus.disconnect()
+        await event_bus.subscribe(handler)
+        
+        # Let the new loop subscribe to its channel before publishing
+        async def channel_subscribed():
+            while not redis_client.subscribers.get("events:user.created"):
+                await asyncio.sleep(0)
+        
+        await asyncio.wait_for(channel_subscribed(), timeout=1.0)
+        
+        event = UserEvent.user_created(
+            event_id=uuid.uuid4().hex,
+            source_service="test_service",
+            user_id=123,
+            username="testuser",
+            email="testuser@example.com"
+        )
+        await event_bus.publish(event, persist=False)
+        
+        delivered = await asyncio.wait_for(received.get(), timeout=1.0)
+        assert delivered.event_id == event.event_id
+        assert received.empty()
+        assert len(event_bus.handlers[EventType.USER_CREATED]) == 1
+        
+        await event_bus.disconnect()
     
     async def test_event_subscription(self, event_subscriber):
         """Test event subscription and handling"""
         try:
-            print("📨 Testing Event Subscription...")
+            log.info("📨 Testing Event Subscription...")
             
             # Track received events
             received_events = []
             
-            # Define event handler
-            @event_subscriber.on_event(EventType.USER_CREATED)
+            # Define event handlers
             async def handle_user_created(event: BaseEvent):
-                print(f"   Received user.created event: {event.event_id}")
+                log.info(f"   Received user.created event: {event.event_id}")
                 received_events.append(event)
             
-            @event_subscriber.on_event(EventType.PRODUCT_CREATED)
             async def handle_product_created(event: BaseEvent):
-                print(f"   Received product.created event: {event.event_id}")
+                log.info(f"   Received product.created event: {event.event_id}")
                 received_events.append(event)
             
-            print(f"   Registered {event_subscriber.get_handler_count()} event handlers")
-            print(f"   Subscribed to events: {[e.value for e in event_subscriber.get_subscribed_events()]}")
+            event_subscriber.register_many({
+                EventType.USER_CREATED: handle_user_created,
+                EventType.PRODUCT_CREATED: handle_product_created,
+            })
+            
+            log.info(f"   Registered {event_subscriber.get_handler_count()} event handlers")
+            log.info("   Subscribed to events: %s", ", ".join(e.value for e in event_subscriber.get_subscribed_events()))
             
             # In real test, this would start subscriptions
             # await event_subscriber.start_all_subscriptions()
             
-            print("✅ Event subscription test simulated successfully")
+            log.info("✅ Event subscription test simulated successfully")
             
         except Exception as e:
-            print(f"❌ Event subscription test failed: {e}")
+            log.error(f"❌ Event subscription test failed: {e}")
     
     async def test_event_schema_validation(self):
         """Test event schema validation"""
         try:
-            print("📋 Testing Event Schema Validation...")
+            log.info("📋 Testing Event Schema Validation...")
+            
+            user_event_id, product_event_id = (uuid.uuid4().hex for _ in range(2))
             
             # Test UserEvent creation
             user_event = UserEvent.user_created(
-                event_id=str(uuid.uuid4()),
+                event_id=user_event_id,
                 source_service="test_service",
                 user_id=123,
                 username="testuser",
@@ -199,15 +430,15 @@ class TestEventCommunication:
                 full_name="Test User"
             )
             
-            assert user_event.event_type == EventType.USER_CREATED
+            assert user_event.event_type is EventType.USER_CREATED
             assert user_event.data["user_id"] == 123
             assert user_event.data["username"] == "testuser"
             
-            print(f"   User event created: {user_event.event_id}")
+            log.info(f"   User event created: {user_event.event_id}")
             
             # Test ProductEvent creation
             product_event = ProductEvent.product_created(
-                event_id=str(uuid.uuid4()),
+                event_id=product_event_id,
                 source_service="test_service",
                 product_id=456,
                 name="Test Product",
@@ -216,26 +447,26 @@ class TestEventCommunication:
                 created_by_user_id=123
             )
             
-            assert product_event.event_type == EventType.PRODUCT_CREATED
+            assert product_event.event_type is EventType.PRODUCT_CREATED
             assert product_event.data["product_id"] == 456
             assert product_event.data["name"] == "Test Product"
             
-            print(f"   Product event created: {product_event.event_id}")
+            log.info(f"   Product event created: {product_event.event_id}")
             
-            print("✅ Event schema validation test passed")
+            log.info("✅ Event schema validation test passed")
             
         except Exception as e:
-            print(f"❌ Event schema validation test failed: {e}")
+            log.error(f"❌ Event schema validation test failed: {e}")
             raise
     
     async def test_event_serialization(self):
         """Test event serialization/deserialization"""
         try:
-            print("🔄 Testing Event Serialization...")
+            log.info("🔄 Testing Event Serialization...")
             
             # Create test event
             original_event = UserEvent.user_created(
-                event_id=str(uuid.uuid4()),
+                event_id=uuid.uuid4().hex,
                 source_service="test_service",
                 user_id=123,
                 username="testuser",
@@ -244,33 +475,94 @@ class TestEventCommunication:
             
             # Serialize to JSON
             json_data = original_event.model_dump_json()
-            print(f"   Serialized event: {len(json_data)} characters")
+            log.info(f"   Serialized event: {len(json_data)} characters")
             
-            # Deserialize from JSON
-            import json
-            event_dict = json.loads(json_data)
-            deserialized_event = BaseEvent.model_validate(event_dict)
+            # Deserialize from JSON (parsed directly by pydantic-core)
+            deserialized_event = BaseEvent.model_validate_json(json_data)
             
             assert deserialized_event.event_id == original_event.event_id
-            assert deserialized_event.event_type == original_event.event_type
+            assert deserialized_event.event_type is original_event.event_type
             assert deserialized_event.data == original_event.data
             
-            print("✅ Event serialization test passed")
+            log.info("✅ Event serialization test passed")
             
         except Exception as e:
-            print(f"❌ Event serialization test failed: {e}")
+            log.error(f"❌ Event serialization test failed: {e}")
             raise
     
+    async def test_event_serialization_orjson(self):
+        """Test orjson and pydantic's JSON encoder round-trip events identically"""
+        orjson = pytest.importorskip("orjson")
+        
+        log.info("⚡ Testing Event Serialization with orjson...")
+        
+        original_event = UserEvent.user_created(
+            event_id=uuid.uuid4().hex,
+            source_service="test_service",
+            user_id=123,
+            username="testuser",
+            email="testuser@example.com"
+        )
+        
+        json_data = original_event.model_dump_json()
+        orjson_data = orjson.dumps(original_event.model_dump())
+        
+        # Both encoders must produce the same event (timings: tests/bench_event_serialization.py)
+        assert orjson.loads(orjson_data) == orjson.loads(json_data)
+        deserialized_event = BaseEvent.model_validate_json(orjson_data)
+        assert deserialized_event.event_id == original_event.event_id
+        assert deserialized_event.data == original_event.data
+        
+        log.info("✅ orjson serialization test passed")
+    
+    def test_factory_events_match_validated_events(self):
+        """Test events built by the factory classmethods equal fully validated ones"""
+        event = ProductEvent.product_created(
+            event_id=uuid.uuid4().hex,
+            source_service="test_service",
+            product_id=456,
+            name="Test Product",
+            price=99.99,
+            category="Electronics",
+            created_by_user_id=123
+        )
+        
+        assert isinstance(event, ProductEvent)
+        assert isinstance(event.timestamp, datetime)
+        assert event.version == "1.0"
+        assert event.metadata == {}
+        assert ProductEvent.model_validate(event.model_dump()) == event
+    
+    async def test_event_wire_format_round_trip(self):
+        """Test BaseEvent.to_bytes/from_bytes round-trip (bytes and decoded str)"""
+        original_event = UserEvent.user_created(
+            event_id=uuid.uuid4().hex,
+            source_service="test_service",
+            user_id=123,
+            username="testuser",
+            email="testuser@example.com"
+        )
+        
+        wire_data = original_event.to_bytes()
+        assert isinstance(wire_data, bytes)
+        
+        # Redis clients created with decode_responses=True hand back str
+        for payload in (wire_data, wire_data.decode()):
+            deserialized_event = BaseEvent.from_bytes(payload)
+            assert deserialized_event.event_id == original_event.event_id
+            assert deserialized_event.event_type is original_event.event_type
+            assert deserialized_event.data == original_event.data
+    
     async def test_correlation_id_tracking(self):
         """Test correlation ID for event tracing"""
         try:
-            print("🔗 Testing Correlation ID Tracking...")
+            log.info("🔗 Testing Correlation ID Tracking...")
             
-            correlation_id = str(uuid.uuid4())
+            correlation_id = uuid.uuid4().hex
             
             # Create related events with same correlation ID
             user_event = UserEvent.user_created(
-                event_id=str(uuid.uuid4()),
+                event_id=uuid.uuid4().hex,
                 source_service="auth_service",
                 user_id=123,
                 username="testuser",
@@ -279,7 +571,7 @@ class TestEventCommunication:
             )
             
             product_event = ProductEvent.product_created(
-                event_id=str(uuid.uuid4()),
+                event_id=uuid.uuid4().hex,
                 source_service="products_service",
                 product_id=456,
                 name="Test Product",
@@ -293,21 +585,21 @@ class TestEventCommunication:
             assert product_event.correlation_id == correlation_id
             assert user_event.correlation_id == product_event.correlation_id
             
-            print(f"   Correlation ID: {correlation_id}")
-            print(f"   User event: {user_event.event_id}")
-            print(f"   Product event: {product_event.event_id}")
+            log.info(f"   Correlation ID: {correlation_id}")
+            log.info(f"   User event: {user_event.event_id}")
+            log.info(f"   Product event: {product_event.event_id}")
             
-            print("✅ Correlation ID tracking test passed")
+            log.info("✅ Correlation ID tracking test passed")
             
         except Exception as e:
-            print(f"❌ Correlation ID tracking test failed: {e}")
+            log.error(f"❌ Correlation ID tracking test failed: {e}")
             raise
 
 
 async def run_event_communication_tests():
     """Run all event communication tests"""
-    print("🚀 Starting Event Communication Tests...")
-    print("=" * 60)
+    log.info("🚀 Starting Event Communication Tests...")
+    log.info("=" * 60)
     
     test_instance = TestEventCommunication()
     
@@ -320,19 +612,22 @@ async def run_event_communication_tests():
     event_publisher = EventPublisher(event_bus)
     event_subscriber = EventSubscriber(event_bus)
     
-    # Run tests
-    await test_instance.test_event_bus_connection(event_bus)
-    await test_instance.test_event_schema_validation()
-    await test_instance.test_event_serialization()
-    await test_instance.test_correlation_id_tracking()
-    await test_instance.test_publish_user_created_event(event_publisher)
-    await test_instance.test_publish_product_created_event(event_publisher)
-    await test_instance.test_publish_stock_updated_event(event_publisher)
-    await test_instance.test_event_subscription(event_subscriber)
-    
-    print("=" * 60)
-    print("✅ Event Communication Tests Completed!")
+    # Run tests concurrently (no shared state)
+    await asyncio.gather(
+        test_instance.test_event_bus_connection(event_bus),
+        test_instance.test_event_schema_validation(),
+        test_instance.test_event_serialization(),
+        test_instance.test_correlation_id_tracking(),
+        test_instance.test_publish_user_created_event(event_publisher),
+        test_instance.test_publish_product_created_event(event_publisher),
+        test_instance.test_publish_stock_updated_event(event_publisher),
+        test_instance.test_event_subscription(event_subscriber)
+    )
+    
+    log.info("=" * 60)
+    log.info("✅ Event Communication Tests Completed!")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("TEST_LOG_LEVEL", "INFO"), format="%(message)s")
     asyncio.run(run_event_communication_tests())
@@ -3,27 +3,133 @@ Full Integration Test for HTTP-based and Event-driven Communication
 """
 
 import asyncio
-import sys
+import io
 import os
-import uuid
-from datetime import datetime
+import sys
+import time
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+
+import pytest
+
+# Wall-clock/monotonic anchor pair - results store monotonic ns, converted to wall time on summary
+_WALL_T0 = time.time()
+_MONO_T0_NS = time.monotonic_ns()
+
+# Integration markers expected in the products router
+ROUTER_FILE = Path(__file__).resolve().parents[1] / "services/products/app/routers/products.py"
+ROUTER_NEEDLES = ("ProductHTTPIntegration", "ProductEventIntegration", "get_http_integration", "correlation_id")
+
+# Public API the products service integrations must expose
+REQUIRED_HTTP_METHODS = frozenset({
+    "get_user_info", "verify_user_exists", "validate_product_permissions", "enrich_product_with_user_info"
+})
+REQUIRED_EVENT_METHODS = frozenset({
+    "publish_product_created", "publish_product_stock_updated", "start_event_subscriptions", "get_event_health"
+})
+REQUIRED_SUBSCRIPTION_KEYS = frozenset({"handler_count", "subscribed_events", "service_name"})
+
+# ServiceRegistry shared by every run of the HTTP suite in this process - closed once in teardown
+_test_registry = None
+
+
+@lru_cache(maxsize=None)
+def _scan_source(path: Path) -> frozenset:
+    """
+    Return the ROUTER_NEEDLES found in a source file (read once per run)
+    
+    Plain read_text, not mmap: the router is a few KB, so mapping it saves
+    nothing measurable and would force bytes needles and an open file handle.
+    """
+    text = path.read_text(encoding="utf-8")
+    return frozenset(needle for needle in ROUTER_NEEDLES if needle in text)
+
+
+def _get_test_registry():
+    """Return the shared test ServiceRegistry, creating it on first use"""
+    global _test_registry
+    if _test_registry is None:
+        from libs.http_client import ServiceRegistry
+        _test_registry = ServiceRegistry()
+    return _test_registry
+
+
+async def _close_test_registry():
+    """Close the shared test registry's HTTP connection pool"""
+    global _test_registry
+    if _test_registry is not None:
+        await _test_registry.close_async()
+        _test_registry = None
 
-# Add path to monorepo root
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from libs.http_client import ServiceClient, AuthServiceClient, ServiceRegistry, ServiceInfo
-from libs.events import EventBus, EventPublisher, EventSubscriber, EventType, BaseEvent
-from libs.service_registry import global_service_registry
+@pytest.fixture(scope="module", autouse=True)
+def shared_test_registry():
+    """Close the shared test registry once after all tests in this module"""
+    yield
+    asyncio.run(_close_test_registry())
+
+
+def _uuids(n: int) -> list:
+    """Generate n random (version 4) UUID strings from a single os.urandom draw"""
+    import uuid
+    
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+class FakeEventBus:
+    """In-process EventBus stand-in used when FAST=1 - never touches Redis"""
+    
+    def __init__(self, redis_url: str = "redis://localhost:6379", service_name: str = "unknown", **kwargs):
+        self.redis_url = redis_url
+        self.service_name = service_name
+        self.is_connected = True
+        self.handlers = {}
+        self.published = []
+    
+    async def connect(self):
+        pass
+    
+    async def disconnect(self):
+        pass
+    
+    async def publish(self, event, correlation_id=None, persist=True) -> bool:
+        if correlation_id:
+            event.correlation_id = correlation_id
+        event.source_service = self.service_name
+        self.published.append(event)
+        return True
+    
+    async def publish_many(self, events, persist=True) -> int:
+        events = list(events)
+        for event in events:
+            await self.publish(event, persist=persist)
+        return len(events)
+    
+    async def subscribe(self, event_handler):
+        self.handlers.setdefault(event_handler.event_type, []).append(event_handler)
+    
+    async def health_check(self) -> dict:
+        return {
+            "status": "healthy",
+            "connected": True,
+            "service_name": self.service_name,
+            "handlers_count": sum(map(len, self.handlers.values()))
+        }
 
 
 class IntegrationTestResults:
     """Track integration test results"""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = None):
         self.tests_run = 0
         self.tests_passed = 0
         self.tests_failed = 0
         self.results = []
+        # Output is buffered and written once on flush(); PYTEST_VERBOSE=1 streams it instead
+        self.verbose = os.getenv("PYTEST_VERBOSE") == "1" if verbose is None else verbose
+        self._out = io.StringIO()
     
     def add_result(self, test_name: str, passed: bool, details: str = ""):
         self.tests_run += 1
@@ -39,52 +145,75 @@ class IntegrationTestResults:
             "status": status,
             "passed": passed,
             "details": details,
-            "timestamp": datetime.now().isoformat()
+            "ts_ns": time.monotonic_ns() - _MONO_T0_NS
         }
         self.results.append(result)
-        print(f"{status}: {test_name}")
+        self.write(f"{status}: {test_name}")
         if details:
-            print(f"   Details: {details}")
+            self.write(f"   Details: {details}")
+    
+    def write(self, message: str):
+        if self.verbose:
+            print(message)
+        else:
+            self._out.write(message + "\n")
+    
+    def flush(self):
+        """Write buffered output to stdout in a single call"""
+        output = self._out.getvalue()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            self._out = io.StringIO()
     
     def get_summary(self):
+        from datetime import datetime, timezone
+        
+        self.flush()
         success_rate = (self.tests_passed / self.tests_run * 100) if self.tests_run > 0 else 0
         return {
             "total_tests": self.tests_run,
             "passed": self.tests_passed,
             "failed": self.tests_failed,
             "success_rate": f"{success_rate:.1f}%",
-            "results": self.results
+            "results": [
+                {**result, "timestamp": datetime.fromtimestamp(_WALL_T0 + result["ts_ns"] / 1e9, tz=timezone.utc).isoformat()}
+                for result in self.results
+            ]
         }
 
 
 async def test_http_service_communication():
     """Test HTTP-based service communication"""
+    # Imported lazily so running a single suite only loads what it needs
+    from libs.http_client import ServiceClient, AuthServiceClient, ServiceInfo
+    from libs.service_registry import global_service_registry
+    
     results = IntegrationTestResults()
     
-    print("🌐 Testing HTTP-based Service Communication")
-    print("-" * 50)
+    results.write("🌐 Testing HTTP-based Service Communication")
+    results.write("-" * 50)
     
     # Test 1: Service Registry Setup
     try:
-        registry = ServiceRegistry()
+        # Registry shared across runs in this process - services are only registered if absent
+        registry = _get_test_registry()
         
-        auth_service = ServiceInfo(
+        auth_service = registry.register_service_idempotent(ServiceInfo(
             name="auth",
             base_url="http://localhost:8001/api/v1",
             health_endpoint="/health"
-        )
-        registry.register_service(auth_service)
+        ))
         
-        products_service = ServiceInfo(
+        products_service = registry.register_service_idempotent(ServiceInfo(
             name="products",
             base_url="http://localhost:8003/api/v1",
             health_endpoint="/health"
-        )
-        registry.register_service(products_service)
+        ))
         
         # Verify services registered
-        assert registry.get_service("auth") is not None
-        assert registry.get_service("products") is not None
+        assert registry.get_service("auth") is auth_service
+        assert registry.get_service("products") is products_service
         
         results.add_result(
             "Service Registry Setup",
@@ -145,26 +274,29 @@ async def test_http_service_communication():
     except Exception as e:
         results.add_result("Service Discovery", False, str(e))
     
-    # Cleanup
-    try:
-        await auth_client.close()
-        await products_client.close()
-    except:
-        pass
-    
+    # Clients share the registry's HTTP connection pool - closed once in teardown
     return results
 
 
 async def test_event_driven_communication():
     """Test event-driven communication"""
+    from libs.events import EventBus, EventPublisher, EventSubscriber, EventType, BaseEvent
+    
+    # Event types used by handler registration and assertions, bound once
+    USER_CREATED, PRODUCT_CREATED = EventType.USER_CREATED, EventType.PRODUCT_CREATED
+    
     results = IntegrationTestResults()
     
-    print("\n📨 Testing Event-driven Communication")
-    print("-" * 50)
+    # IDs for Tests 4-6, drawn in one batch
+    ids = _uuids(5)
     
-    # Test 1: Event Bus Setup
+    results.write("\n📨 Testing Event-driven Communication")
+    results.write("-" * 50)
+    
+    # Test 1: Event Bus Setup (FAST=1 swaps in an in-process bus so no Redis connection is attempted)
     try:
-        event_bus = EventBus(
+        event_bus_cls = FakeEventBus if os.getenv("FAST") == "1" else EventBus
+        event_bus = event_bus_cls(
             redis_url="redis://localhost:6379",
             service_name="integration_test"
         )
@@ -179,7 +311,7 @@ async def test_event_driven_communication():
         results.add_result(
             "Event Bus Setup",
             True,
-            f"Event bus configured for service: {event_bus.service_name}"
+            f"{event_bus_cls.__name__} configured for service: {event_bus.service_name}"
         )
         
     except Exception as e:
@@ -202,16 +334,16 @@ async def test_event_driven_communication():
     try:
         subscriber = EventSubscriber(event_bus)
         
-        # Register event handlers
-        received_events = []
+        # Register event handlers (set of (kind, event_id) - O(1) membership, redeliveries collapse)
+        received_events = set()
         
-        @subscriber.on_event(EventType.USER_CREATED)
+        @subscriber.on_event(USER_CREATED)
         async def handle_user_created(event: BaseEvent):
-            received_events.append(("user_created", event.event_id))
+            received_events.add(("user_created", event.event_id))
         
-        @subscriber.on_event(EventType.PRODUCT_CREATED)
+        @subscriber.on_event(PRODUCT_CREATED)
         async def handle_product_created(event: BaseEvent):
-            received_events.append(("product_created", event.event_id))
+            received_events.add(("product_created", event.event_id))
         
         handler_count = subscriber.get_handler_count()
         subscribed_events = subscriber.get_subscribed_events()
@@ -231,7 +363,7 @@ async def test_event_driven_communication():
         
         # Test UserEvent creation
         user_event = UserEvent.user_created(
-            event_id=str(uuid.uuid4()),
+            event_id=ids.pop(),
             source_service="test_service",
             user_id=123,
             username="testuser",
@@ -240,7 +372,7 @@ async def test_event_driven_communication():
         
         # Test ProductEvent creation
         product_event = ProductEvent.product_created(
-            event_id=str(uuid.uuid4()),
+            event_id=ids.pop(),
             source_service="test_service",
             product_id=456,
             name="Test Product",
@@ -250,8 +382,8 @@ async def test_event_driven_communication():
         )
         
         # Validate event structure
-        assert user_event.event_type == EventType.USER_CREATED
-        assert product_event.event_type == EventType.PRODUCT_CREATED
+        assert user_event.event_type is USER_CREATED
+        assert product_event.event_type is PRODUCT_CREATED
         assert user_event.data["user_id"] == 123
         assert product_event.data["product_id"] == 456
         
@@ -266,21 +398,19 @@ async def test_event_driven_communication():
     
     # Test 5: Event Serialization
     try:
-        # Test JSON serialization
-        json_data = user_event.model_dump_json()
+        # Test JSON serialization (wire format)
+        json_data = user_event.to_bytes()
         
         # Test deserialization
-        import json
-        event_dict = json.loads(json_data)
-        deserialized_event = BaseEvent.model_validate(event_dict)
+        deserialized_event = BaseEvent.from_bytes(json_data)
         
         assert deserialized_event.event_id == user_event.event_id
-        assert deserialized_event.event_type == user_event.event_type
+        assert deserialized_event.event_type is user_event.event_type
         
         results.add_result(
             "Event Serialization",
             True,
-            f"Successfully serialized/deserialized event ({len(json_data)} chars)"
+            f"Successfully serialized/deserialized event ({len(json_data)} bytes)"
         )
         
     except Exception as e:
@@ -288,11 +418,11 @@ async def test_event_driven_communication():
     
     # Test 6: Correlation ID Tracking
     try:
-        correlation_id = str(uuid.uuid4())
+        correlation_id = ids.pop()
         
         # Create related events with same correlation ID
         event1 = UserEvent.user_created(
-            event_id=str(uuid.uuid4()),
+            event_id=ids.pop(),
             source_service="auth_service",
             user_id=123,
             username="testuser",
@@ -301,7 +431,7 @@ async def test_event_driven_communication():
         )
         
         event2 = ProductEvent.product_created(
-            event_id=str(uuid.uuid4()),
+            event_id=ids.pop(),
             source_service="products_service",
             product_id=456,
             name="Test Product",
@@ -331,8 +461,8 @@ async def test_product_service_integration():
     """Test Product Service integration with HTTP and Event communication"""
     results = IntegrationTestResults()
     
-    print("\n🛍️ Testing Product Service Integration")
-    print("-" * 50)
+    results.write("\n🛍️ Testing Product Service Integration")
+    results.write("-" * 50)
     
     # Test 1: Integration Classes Import
     try:
@@ -353,11 +483,9 @@ async def test_product_service_integration():
     
     # Test 2: HTTP Integration Methods
     try:
-        # Test method availability
-        assert hasattr(http_integration, 'get_user_info')
-        assert hasattr(http_integration, 'verify_user_exists')
-        assert hasattr(http_integration, 'validate_product_permissions')
-        assert hasattr(http_integration, 'enrich_product_with_user_info')
+        # Test method availability (one dir() walk, reports every missing name)
+        missing = REQUIRED_HTTP_METHODS.difference(dir(http_integration))
+        assert not missing, f"Missing HTTP integration methods: {sorted(missing)}"
         
         results.add_result(
             "HTTP Integration Methods",
@@ -371,16 +499,13 @@ async def test_product_service_integration():
     # Test 3: Event Integration Methods
     try:
         # Test method availability
-        assert hasattr(event_integration, 'publish_product_created')
-        assert hasattr(event_integration, 'publish_product_stock_updated')
-        assert hasattr(event_integration, 'start_event_subscriptions')
-        assert hasattr(event_integration, 'get_event_health')
+        missing = REQUIRED_EVENT_METHODS.difference(dir(event_integration))
+        assert not missing, f"Missing event integration methods: {sorted(missing)}"
         
         # Test subscription info
         subscription_info = event_integration.get_subscription_info()
-        assert 'handler_count' in subscription_info
-        assert 'subscribed_events' in subscription_info
-        assert 'service_name' in subscription_info
+        missing = REQUIRED_SUBSCRIPTION_KEYS - subscription_info.keys()
+        assert not missing, f"Missing subscription info keys: {sorted(missing)}"
         
         results.add_result(
             "Event Integration Methods",
@@ -393,29 +518,29 @@ async def test_product_service_integration():
     
     # Test 4: Router Integration
     try:
-        # Check if router file has been updated with integrations
-        router_file = "services/products/app/routers/products.py"
-        
-        with open(router_file, 'r', encoding='utf-8') as f:
-            router_content = f.read()
+        # Check if router file has been updated with integrations (single scan for all markers)
+        found = _scan_source(ROUTER_FILE)
         
         # Check for integration imports
-        has_http_integration = "ProductHTTPIntegration" in router_content
-        has_event_integration = "ProductEventIntegration" in router_content
-        has_dependency_functions = "get_http_integration" in router_content
-        has_correlation_id = "correlation_id" in router_content
-        
-        all_integrations_present = all([
-            has_http_integration,
-            has_event_integration, 
-            has_dependency_functions,
-            has_correlation_id
-        ])
+        has_http_integration = "ProductHTTPIntegration" in found
+        has_event_integration = "ProductEventIntegration" in found
+        has_dependency_functions = "get_http_integration" in found
+        has_correlation_id = "correlation_id" in found
+        
+        # One bit per check; all four present <=> mask == 0b1111
+        mask = (
+            has_http_integration
+            | has_event_integration << 1
+            | has_dependency_functions << 2
+            | has_correlation_id << 3
+        )
+        all_integrations_present = mask == 0b1111
+        missing_count = 4 - mask.bit_count()
         
         results.add_result(
             "Router Integration",
             all_integrations_present,
-            f"HTTP: {has_http_integration}, Event: {has_event_integration}, Dependencies: {has_dependency_functions}, Correlation: {has_correlation_id}"
+            f"HTTP: {has_http_integration}, Event: {has_event_integration}, Dependencies: {has_dependency_functions}, Correlation: {has_correlation_id}, Missing: {missing_count}"
         )
         
     except Exception as e:
@@ -428,20 +553,28 @@ async def run_full_integration_tests():
     """Run comprehensive integration tests"""
     print("🚀 Starting Full Integration Tests")
     print("=" * 80)
-    print(f"Test started at: {datetime.now().isoformat()}")
+    print(f"Test started at: {time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}")
     print("=" * 80)
     
-    # Run all test suites
-    http_results = await test_http_service_communication()
-    event_results = await test_event_driven_communication()
-    integration_results = await test_product_service_integration()
+    # Run all test suites concurrently (each suite owns its event bus)
+    try:
+        http_results, event_results, integration_results = await asyncio.gather(
+            test_http_service_communication(),
+            test_event_driven_communication(),
+            test_product_service_integration()
+        )
+    finally:
+        await _close_test_registry()
     
     # Combine results
+    suites = (http_results, event_results, integration_results)
     all_results = IntegrationTestResults()
-    all_results.tests_run = http_results.tests_run + event_results.tests_run + integration_results.tests_run
-    all_results.tests_passed = http_results.tests_passed + event_results.tests_passed + integration_results.tests_passed
-    all_results.tests_failed = http_results.tests_failed + event_results.tests_failed + integration_results.tests_failed
-    all_results.results = http_results.results + event_results.results + integration_results.results
+    for suite in suites:
+        suite.flush()
+        all_results.tests_run += suite.tests_run
+        all_results.tests_passed += suite.tests_passed
+        all_results.tests_failed += suite.tests_failed
+    all_results.results = list(chain.from_iterable(suite.results for suite in suites))
     
     # Generate comprehensive report
     print("\n" + "=" * 80)
@@ -460,18 +593,15 @@ async def run_full_integration_tests():
     
     # HTTP Communication Results
     print(f"\n🌐 HTTP Communication ({http_results.tests_passed}/{http_results.tests_run} passed):")
-    for result in http_results.results:
-        print(f"   {result['status']}: {result['test_name']}")
+    sys.stdout.write("".join(f"   {result['status']}: {result['test_name']}\n" for result in http_results.results))
     
     # Event Communication Results
     print(f"\n📨 Event Communication ({event_results.tests_passed}/{event_results.tests_run} passed):")
-    for result in event_results.results:
-        print(f"   {result['status']}: {result['test_name']}")
+    sys.stdout.write("".join(f"   {result['status']}: {result['test_name']}\n" for result in event_results.results))
     
     # Integration Results
     print(f"\n🛍️ Product Service Integration ({integration_results.tests_passed}/{integration_results.tests_run} passed):")
-    for result in integration_results.results:
-        print(f"   {result['status']}: {result['test_name']}")
+    sys.stdout.write("".join(f"   {result['status']}: {result['test_name']}\n" for result in integration_results.results))
     
     # Architecture Analysis
     print(f"\n🏗️ Architecture Analysis:")
@@ -489,11 +619,18 @@ async def run_full_integration_tests():
     
     print("\n" + "=" * 80)
     print(f"✅ Full Integration Tests Completed Successfully!")
-    print(f"Test completed at: {datetime.now().isoformat()}")
+    print(f"Test completed at: {time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}")
     print("=" * 80)
     
     return summary
 
 
 if __name__ == "__main__":
+    # uvloop is optional (not available on Windows) - fall back to the default asyncio loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(run_full_integration_tests())
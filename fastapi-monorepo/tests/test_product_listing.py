@@ -0,0 +1,61 @@
+"""
+Test danh sách sản phẩm của Products service (projection + filters)
+"""
+
+from decimal import Decimal
+
+from sqlalchemy import event
+
+from services.products.app.schemas.product import ProductSearchParams, ProductListItem
+from services.products.app.services.product_service import ProductService
+
+
+def _list_ids(db, **params) -> list:
+    items, _ = ProductService(db).get_products(ProductSearchParams(**params))
+    return sorted(item.id for item in items)
+
+
+def test_get_products_selects_only_listing_columns(db):
+    """get_products chỉ select các cột listing và trả về ProductListItem"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        items, total = ProductService(db).get_products(ProductSearchParams())
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert total == 3  # sản phẩm inactive bị loại
+    assert all(isinstance(item, ProductListItem) for item in items)
+    assert {item.id: item.price for item in items} == {1: Decimal("10"), 2: Decimal("5"), 4: Decimal("50")}
+
+    [listing_query] = [s for s in statements if "LIMIT" in s]
+    assert "products.description" not in listing_query
+    assert "products.created_at" not in listing_query
+
+
+def test_get_products_filters_by_name_and_category(db):
+    """Filter name / category không phân biệt hoa thường và kết hợp bằng AND"""
+    assert _list_ids(db, name="mouse") == [2]
+    assert _list_ids(db, category="furniture") == [4]
+    assert _list_ids(db, category="electronics", name="key") == [1]
+    assert _list_ids(db, category="electronics", name="chair") == []
+
+
+def test_get_products_filters_by_price_range(db):
+    """min_price / max_price là biên bao gồm"""
+    assert _list_ids(db, min_price=10) == [1, 4]
+    assert _list_ids(db, max_price=10) == [1, 2]
+    assert _list_ids(db, min_price=6, max_price=50) == [1, 4]
+
+
+def test_get_products_paginates_after_filtering(db):
+    """total đếm trên kết quả đã filter, không phụ thuộc phân trang"""
+    items, total = ProductService(db).get_products(ProductSearchParams(category="electronics", per_page=1, page=2))
+
+    assert total == 2
+    assert len(items) == 1
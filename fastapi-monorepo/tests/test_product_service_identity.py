@@ -0,0 +1,18 @@
+"""
+Test ProductService chỉ có một implementation (kế thừa BaseService)
+"""
+
+from libs.common.base_service import BaseService
+from services.products.app.services import product_service
+from services.products.app.routers import products as products_router
+
+
+def test_product_service_inherits_base_service():
+    """ProductService phải là bản kế thừa BaseService"""
+    assert BaseService in product_service.ProductService.__mro__
+
+
+def test_router_uses_service_module_dependency():
+    """Router dùng đúng ProductService / get_product_service từ service module"""
+    assert products_router.ProductService is product_service.ProductService
+    assert products_router.get_product_service is product_service.get_product_service
@@ -0,0 +1,126 @@
+"""
+Test cập nhật tồn kho hàng loạt của Products service (service + endpoint)
+"""
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from libs.auth.jwt_utils import get_current_user_id
+from libs.events import EventPublishError
+from services.products.app.models.product import Product
+from services.products.app.services.product_service import ProductService, get_product_service
+from services.products.app.integrations.event_integration import ProductEventIntegration
+from services.products.app.routers import products as products_router
+
+
+def _stock(db, product_id: int) -> int:
+    db.expire_all()
+    return db.get(Product, product_id).stock_quantity
+
+
+def test_bulk_update_stock_applies_deltas(db):
+    """Mọi delta được áp dụng và trả về tồn kho mới"""
+    new_stock = ProductService(db).bulk_update_stock({1: -4, 2: 2})
+
+    assert new_stock == {1: 6, 2: 5}
+    assert _stock(db, 1) == 6
+    assert _stock(db, 2) == 5
+
+
+def test_bulk_update_stock_is_all_or_nothing(db):
+    """Một sản phẩm không đủ tồn kho / không tồn tại thì không sản phẩm nào được cập nhật"""
+    service = ProductService(db)
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.bulk_update_stock({1: -1, 2: -4})
+    assert exc_info.value.status_code == 400
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.bulk_update_stock({1: -1, 3: 1})
+    assert exc_info.value.status_code == 404
+
+    assert _stock(db, 1) == 10
+    assert _stock(db, 2) == 3
+
+
+def test_bulk_update_stock_keeps_concurrent_deltas(db):
+    """Delta được cộng trong SQL - ghi đồng thời sau SELECT không bị mất"""
+
+    @event.listens_for(db, "do_orm_execute")
+    def concurrent_writer(orm_execute_state):
+        # Một transaction khác cộng thêm 5 ngay sau khi bulk_update_stock đọc tồn kho
+        if orm_execute_state.is_select:
+            frozen = orm_execute_state.invoke_statement().freeze()
+            orm_execute_state.session.connection().exec_driver_sql(
+                "UPDATE products SET stock_quantity = stock_quantity + 5 WHERE id = 1"
+            )
+            return frozen()
+
+    new_stock = ProductService(db).bulk_update_stock({1: 3})
+    event.remove(db, "do_orm_execute", concurrent_writer)
+
+    assert new_stock == {1: 18}
+    assert _stock(db, 1) == 18
+
+
+class FakeHTTPIntegration:
+    def __init__(self):
+        self.permission_checks = []
+
+    async def validate_product_permissions(self, user_id, action, jwt_token):
+        self.permission_checks.append((user_id, action, jwt_token))
+        return True
+
+
+class FakeEventIntegration:
+    def __init__(self):
+        self.published = []
+
+    async def publish_product_stock_updates(self, stock_changes, updated_by_user_id, correlation_id=None):
+        self.published.append((stock_changes, updated_by_user_id, correlation_id))
+        return len(stock_changes)
+
+
+def test_bulk_stock_endpoint_checks_permissions_and_publishes_events(db):
+    """Endpoint bulk kiểm tra quyền và publish một product.stock_updated event cho mỗi sản phẩm thay đổi"""
+    http_integration = FakeHTTPIntegration()
+    event_integration = FakeEventIntegration()
+
+    app = FastAPI()
+    app.include_router(products_router.router)
+    app.dependency_overrides[get_current_user_id] = lambda: 7
+    app.dependency_overrides[get_product_service] = lambda: ProductService(db)
+    app.dependency_overrides[products_router.get_http_integration] = lambda: http_integration
+    app.dependency_overrides[products_router.get_event_integration] = lambda: event_integration
+
+    response = TestClient(app).patch(
+        "/products/stock/bulk",
+        json={"changes": {"1": -4, "2": 0}},
+        headers={"Authorization": "Bearer test-token"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["stock"] == {"1": 6, "2": 3}
+    assert http_integration.permission_checks == [(7, "manage_stock", "test-token")]
+
+    [(stock_changes, updated_by_user_id, correlation_id)] = event_integration.published
+    assert stock_changes == {1: (10, 6)}  # product 2 không đổi -> không có event
+    assert updated_by_user_id == 7
+    assert correlation_id
+
+
+class PartiallyFailingPublisher:
+    async def publish_product_stock_updates(self, stock_changes, updated_by_user_id, correlation_id=None):
+        raise EventPublishError("batch 2 failed", published_count=1)
+
+
+async def test_publish_stock_updates_reports_partial_publish():
+    """Batch lỗi giữa chừng -> trả về số event đã publish thay vì 0"""
+    event_integration = ProductEventIntegration()
+    event_integration.publisher = PartiallyFailingPublisher()
+
+    published = await event_integration.publish_product_stock_updates({1: (10, 6), 2: (3, 5)}, updated_by_user_id=7)
+
+    assert published == 1